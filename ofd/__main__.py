@@ -30,9 +30,12 @@ from pathlib import Path
 
 import argcomplete
 
-# Ensure project root is in path for imports
+# Ensure project root is in path for imports when run as a plain file
+# (python ofd/__main__.py); "python -m ofd" and the installed entry point
+# already resolve the package
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if not __package__:
+    sys.path.insert(0, str(project_root))
 
 from ofd.commands import build, script, serve, validate, webui  # noqa: E402
 
@@ -66,7 +69,7 @@ def create_parser() -> argparse.ArgumentParser:
         epilog="""
 Command Details:
   validate   [--json-files] [--logos] [--folder-names] [--store-ids] [--gtin]
-  build      [-o DIR] [--skip-json] [--skip-sqlite] [--skip-csv] [--skip-api]
+  build      [-o DIR] [--force] [--hash-algo ALGO] [--skip-json] [--skip-sqlite] [--skip-csv] [--skip-parquet] [--skip-api]
   serve      [-d DIR] [-p PORT] [--host HOST]
   script     [--list] <script_name> [script_args...]
   webui      [-p PORT] [--host HOST] [--open] [--install]
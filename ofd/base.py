@@ -180,6 +180,10 @@ class BaseScript(ABC):
 # Registry of available scripts
 _script_registry: dict[str, type[BaseScript]] = {}
 
+# Bumped on every registration so list_scripts() knows when its cache is stale
+_registry_version = 0
+_list_scripts_cache: tuple[int, list[tuple[str, str, list[str]]]] | None = None
+
 
 def register_script(script_class: type[BaseScript]) -> type[BaseScript]:
     """
@@ -191,7 +195,9 @@ def register_script(script_class: type[BaseScript]) -> type[BaseScript]:
             name = "my_script"
             ...
     """
+    global _registry_version
     _script_registry[script_class.name] = script_class
+    _registry_version += 1
     return script_class
 
 
@@ -204,9 +210,15 @@ def list_scripts() -> list[tuple[str, str, list[str]]]:
     """
     List all registered scripts with their descriptions and key arguments.
 
+    The listing is cached until another script is registered.
+
     Returns:
         List of tuples: (name, description, key_args)
     """
+    global _list_scripts_cache
+    if _list_scripts_cache is not None and _list_scripts_cache[0] == _registry_version:
+        return list(_list_scripts_cache[1])
+
     result = []
     for name, cls in sorted(_script_registry.items()):
         # Get key arguments by instantiating and checking the parser
@@ -225,4 +237,5 @@ def list_scripts() -> list[tuple[str, str, list[str]]]:
 
         result.append((name, cls.description, key_args))
 
-    return result
+    _list_scripts_cache = (_registry_version, result)
+    return list(result)
@@ -22,21 +22,56 @@ Or programmatically:
 
 __version__ = "3.0.0"
 
-from .crawler import DataCrawler, crawl_data
-from .exporters import (
-    export_api,
-    export_badges,
-    export_csv,
-    export_json,
-    export_sqlite,
-)
-from .models import ENTITY_TYPES, Database, DocumentType
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .crawler import DataCrawler, crawl_data
+    from .exporters import (
+        export_api,
+        export_badges,
+        export_csv,
+        export_json,
+        export_sqlite,
+    )
+    from .models import ENTITY_TYPES, Database, DatabaseIndex, DocumentType
+
+# Public names are resolved on first access so that importing a light
+# submodule (e.g. ofd.builder.utils) does not pull in every exporter
+_LAZY_ATTRS = {
+    "Database": ".models",
+    "DatabaseIndex": ".models",
+    "DocumentType": ".models",
+    "ENTITY_TYPES": ".models",
+    "crawl_data": ".crawler",
+    "DataCrawler": ".crawler",
+    "export_json": ".exporters",
+    "export_sqlite": ".exporters",
+    "export_csv": ".exporters",
+    "export_api": ".exporters",
+    "export_badges": ".exporters",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # Version
     "__version__",
     # Models
     "Database",
+    "DatabaseIndex",
     "DocumentType",
     "ENTITY_TYPES",
     # Crawler
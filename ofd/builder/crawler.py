@@ -6,6 +6,9 @@ computed fields (UUIDs, slugs, foreign keys) overlaid on top.
 """
 
 import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .errors import BuildResult
@@ -19,10 +22,26 @@ from .utils import (
     generate_size_id,
     generate_store_id,
     generate_variant_id,
+    loads_json,
     normalize_color_hex,
     slugify,
 )
 
+# Every JSON file the crawler reads; anything else in the tree is ignored
+_ENTITY_JSON_FILES = frozenset(
+    {"store.json", "brand.json", "material.json", "filament.json", "variant.json", "sizes.json"}
+)
+
+
+def _intern(value):
+    """Intern a small-vocabulary string value; non-strings are returned unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_list(values: list) -> list:
+    """Intern the string entries of a list (e.g. country codes)."""
+    return [_intern(v) for v in values]
+
 
 class DataCrawler:
     """Crawls the data directory structure and builds normalized database."""
@@ -38,15 +57,21 @@ class DataCrawler:
         self._material_cache: dict[str, str] = {}  # brand_id:material -> id
         self._store_cache: dict[str, str] = {}  # original_id -> uuid
 
+        # Raw contents of prefetched JSON files, consumed by _load_json
+        self._json_bytes: dict[Path, bytes] = {}
+
     def crawl(self) -> tuple[Database, BuildResult]:
         """Crawl all data and return the populated database and any errors."""
         print("Starting data crawl...")
 
+        self._prefetch_json()
+
         # Crawl stores first (so we can validate purchase links)
         self._crawl_stores_directory()
 
         # Crawl main data directory (brands/materials/products/variants)
         self._crawl_data_directory()
+        self._json_bytes.clear()
 
         # Print summary
         print("\nCrawl complete!")
@@ -60,6 +85,38 @@ class DataCrawler:
 
         return self.db, self._result
 
+    def _prefetch_json(self):
+        """
+        Read all entity JSON files up front on a thread pool.
+
+        The tree is walked once with os.walk and file reads (which release the
+        GIL) overlap; parsing stays on the crawling thread so error handling
+        and entity order are unchanged.
+        """
+        paths = []
+        for root in (self.stores_dir, self.data_dir):
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                paths.extend(Path(dirpath, f) for f in filenames if f in _ENTITY_JSON_FILES)
+
+        def read(path: Path) -> bytes | None:
+            try:
+                return path.read_bytes()
+            except OSError:
+                return None  # re-raised by _load_json when the file is crawled
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for path, raw in zip(paths, executor.map(read, paths), strict=True):
+                if raw is not None:
+                    self._json_bytes[path] = raw
+
+    def _load_json(self, path: Path):
+        """Parse a JSON file, using its prefetched contents when available."""
+        raw = self._json_bytes.pop(path, None)
+        if raw is None:
+            raw = path.read_bytes()
+        return loads_json(raw)
+
     def _crawl_stores_directory(self):
         """Crawl the stores/ directory."""
         if not self.stores_dir.exists():
@@ -83,8 +140,7 @@ class DataCrawler:
             return
 
         try:
-            with open(store_json, encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._load_json(store_json)
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", store_json)
             return
@@ -106,8 +162,8 @@ class DataCrawler:
             "directory_name": store_dir.name,  # internal, stripped on export
             "storefront_url": data.get("storefront_url", ""),
             "logo": data.get("logo", ""),
-            "ships_from": ensure_list(data.get("ships_from", [])),
-            "ships_to": ensure_list(data.get("ships_to", [])),
+            "ships_from": _intern_list(ensure_list(data.get("ships_from", []))),
+            "ships_to": _intern_list(ensure_list(data.get("ships_to", []))),
         }
 
         self.db.stores.append(store)
@@ -139,8 +195,7 @@ class DataCrawler:
             return
 
         try:
-            with open(brand_json, encoding="utf-8") as f:
-                brand_data = json.load(f)
+            brand_data = self._load_json(brand_json)
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", brand_json)
             return
@@ -156,7 +211,7 @@ class DataCrawler:
             "directory_name": brand_name,  # internal, stripped on export
             "website": brand_data.get("website", ""),
             "logo": brand_data.get("logo", ""),
-            "origin": brand_data.get("origin", "Unknown"),
+            "origin": _intern(brand_data.get("origin", "Unknown")),
         }
 
         self.db.brands.append(brand)
@@ -173,15 +228,15 @@ class DataCrawler:
 
     def _process_material_directory(self, material_dir: Path, brand_id: str):
         """Process a material directory under a brand."""
-        material_name = material_dir.name
+        # Material names repeat across every brand, intern them to share one object
+        material_name = sys.intern(material_dir.name)
 
         # Load material.json if exists
         material_json = material_dir / "material.json"
         material_data = {}
         if material_json.exists():
             try:
-                with open(material_json, encoding="utf-8") as f:
-                    material_data = json.load(f)
+                material_data = self._load_json(material_json)
             except (OSError, json.JSONDecodeError) as e:
                 self._result.add_warning("JSON Parse", f"Failed to parse: {e}", material_json)
 
@@ -197,7 +252,7 @@ class DataCrawler:
                 "brand_id": brand_id,
                 "material": material_data.get("material", material_name),
                 "slug": slugify(material_name),
-                "material_class": material_data.get("material_class", "FFF"),
+                "material_class": _intern(material_data.get("material_class", "FFF")),
             }
 
             self.db.materials.append(material)
@@ -223,8 +278,7 @@ class DataCrawler:
             return
 
         try:
-            with open(filament_json, encoding="utf-8") as f:
-                filament_data = json.load(f)
+            filament_data = self._load_json(filament_json)
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", filament_json)
             return
@@ -270,8 +324,7 @@ class DataCrawler:
             return
 
         try:
-            with open(variant_json, encoding="utf-8") as f:
-                variant_data = json.load(f)
+            variant_data = self._load_json(variant_json)
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", variant_json)
             return
@@ -289,6 +342,7 @@ class DataCrawler:
             color_hex = normalize_color_hex(color_hex_raw[0]) if color_hex_raw else "#000000"
         else:
             color_hex = normalize_color_hex(color_hex_raw) or "#000000"
+        color_hex = _intern(color_hex)
 
         # Normalize hex variants if present
         hex_variants = variant_data.get("hex_variants")
@@ -318,8 +372,7 @@ class DataCrawler:
     def _process_sizes_file(self, sizes_json: Path, variant_id: str):
         """Process sizes.json file to create sizes and purchase links."""
         try:
-            with open(sizes_json, encoding="utf-8") as f:
-                sizes_data = json.load(f)
+            sizes_data = self._load_json(sizes_json)
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", sizes_json)
             return
@@ -412,9 +465,9 @@ class DataCrawler:
         }
         # Normalize ships_from/ships_to if present
         if purchase_link.get("ships_from"):
-            purchase_link["ships_from"] = ensure_list(purchase_link["ships_from"])
+            purchase_link["ships_from"] = _intern_list(ensure_list(purchase_link["ships_from"]))
         if purchase_link.get("ships_to"):
-            purchase_link["ships_to"] = ensure_list(purchase_link["ships_to"])
+            purchase_link["ships_to"] = _intern_list(ensure_list(purchase_link["ships_to"]))
 
         self.db.purchase_links.append(purchase_link)
 
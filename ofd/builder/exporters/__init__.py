@@ -8,6 +8,7 @@ from .csv_exporter import export_csv
 from .directory_listing_exporter import export_directory_listings
 from .html_exporter import export_html
 from .json_exporter import export_all_json, export_json, export_ndjson, export_per_brand_json
+from .parquet_exporter import export_parquet
 from .sqlite_exporter import export_sqlite
 from .sqlite_stores_exporter import export_sqlite_stores
 
@@ -19,6 +20,7 @@ __all__ = [
     "export_sqlite",
     "export_sqlite_stores",
     "export_csv",
+    "export_parquet",
     "export_api",
     "export_html",
     "export_directory_listings",
@@ -12,6 +12,7 @@ from pathlib import Path
 
 from ..models import Database
 from ..serialization import entity_to_dict
+from ..utils import dumps_json
 
 
 def merge_schemas(base_schema: dict, logo_schema: dict) -> dict:
@@ -79,8 +80,7 @@ def export_schemas(
 
                 # Write merged schema
                 dest = schemas_path / logo_schema_name
-                with open(dest, "w", encoding="utf-8") as f:
-                    json.dump(merged_schema, f, indent=2, ensure_ascii=False)
+                dest.write_bytes(dumps_json(merged_schema))
 
                 # Extract schema name (e.g., "brand_logo_schema.json" -> "brand_logo")
                 name = schema_file.stem.replace("_schema", "") + "_logo"
@@ -130,8 +130,7 @@ def export_schemas(
     }
 
     index_path = schemas_path / "index.json"
-    with open(index_path, "w", encoding="utf-8") as f:
-        json.dump(schemas_index, f, indent=2, ensure_ascii=False)
+    index_path.write_bytes(dumps_json(schemas_index))
 
     return len(schema_files)
 
@@ -139,8 +138,7 @@ def export_schemas(
 def write_json(path: Path, data: dict):
     """Write JSON file with consistent formatting."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    path.write_bytes(dumps_json(data))
 
 
 def generate_logo_id(name: str, logo_filename: str) -> tuple[str, str]:
@@ -329,25 +327,12 @@ def export_api(
     print(f"  Written: {brand_logos_count} brand logos, {store_logos_count} store logos")
 
     # Build lookup maps for efficient access
-    materials_by_brand = {}
-    for m in db.materials:
-        materials_by_brand.setdefault(m["brand_id"], []).append(m)
-
-    filaments_by_material = {}
-    for f in db.filaments:
-        filaments_by_material.setdefault(f["material_id"], []).append(f)
-
-    variants_by_filament = {}
-    for v in db.variants:
-        variants_by_filament.setdefault(v["filament_id"], []).append(v)
-
-    sizes_by_variant = {}
-    for s in db.sizes:
-        sizes_by_variant.setdefault(s["variant_id"], []).append(s)
-
-    purchase_links_by_size = {}
-    for pl in db.purchase_links:
-        purchase_links_by_size.setdefault(pl["size_id"], []).append(pl)
+    idx = db.index()
+    materials_by_brand = idx.materials_by_brand
+    filaments_by_material = idx.filaments_by_material
+    variants_by_filament = idx.variants_by_filament
+    sizes_by_variant = idx.sizes_by_variant
+    purchase_links_by_size = idx.purchase_links_by_size
 
     # Root index
     endpoints = {
@@ -8,6 +8,7 @@ from pathlib import Path
 
 from ..models import Database
 from ..serialization import entity_to_dict
+from ..utils import dumps_json
 
 
 def database_to_dict(db: Database, version: str, generated_at: str) -> dict:
@@ -34,8 +35,7 @@ def export_all_json(db: Database, output_dir: str, version: str, generated_at: s
 
     # Write uncompressed JSON
     all_json_path = output_path / "all.json"
-    with open(all_json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    all_json_path.write_bytes(dumps_json(data))
     print(f"  Written: {all_json_path}")
 
     # Write gzip compressed JSON
@@ -96,16 +96,20 @@ def export_per_brand_json(db: Database, output_dir: str, version: str, generated
     # Build index
     index = {"version": version, "generated_at": generated_at, "brands": []}
 
+    # Group children by parent once instead of rescanning every list per brand
+    idx = db.index()
+
     for brand in db.brands:
         # Get all data for this brand
-        brand_materials = [m for m in db.materials if m["brand_id"] == brand["id"]]
-        brand_filaments = [f for f in db.filaments if f["brand_id"] == brand["id"]]
-        brand_filament_ids = {f["id"] for f in brand_filaments}
-        brand_variants = [v for v in db.variants if v["filament_id"] in brand_filament_ids]
-        brand_variant_ids = {v["id"] for v in brand_variants}
-        brand_sizes = [s for s in db.sizes if s["variant_id"] in brand_variant_ids]
-        brand_size_ids = {s["id"] for s in brand_sizes}
-        brand_purchase_links = [pl for pl in db.purchase_links if pl["size_id"] in brand_size_ids]
+        brand_materials = idx.materials_by_brand.get(brand["id"], [])
+        brand_filaments = idx.filaments_by_brand.get(brand["id"], [])
+        brand_variants = [
+            v for f in brand_filaments for v in idx.variants_by_filament.get(f["id"], [])
+        ]
+        brand_sizes = [s for v in brand_variants for s in idx.sizes_by_variant.get(v["id"], [])]
+        brand_purchase_links = [
+            pl for s in brand_sizes for pl in idx.purchase_links_by_size.get(s["id"], [])
+        ]
 
         brand_data = {
             "version": version,
@@ -120,8 +124,7 @@ def export_per_brand_json(db: Database, output_dir: str, version: str, generated
 
         # Write brand JSON
         brand_json_path = output_path / f"{brand['slug']}.json"
-        with open(brand_json_path, "w", encoding="utf-8") as f:
-            json.dump(brand_data, f, indent=2, ensure_ascii=False)
+        brand_json_path.write_bytes(dumps_json(brand_data))
 
         # Add to index
         index["brands"].append(
@@ -135,8 +138,7 @@ def export_per_brand_json(db: Database, output_dir: str, version: str, generated
 
     # Write index
     index_path = output_path / "index.json"
-    with open(index_path, "w", encoding="utf-8") as f:
-        json.dump(index, f, indent=2, ensure_ascii=False)
+    index_path.write_bytes(dumps_json(index))
     print(f"  Written: {index_path} and {len(db.brands)} brand files")
 
 
@@ -0,0 +1,102 @@
+"""
+Parquet exporter that writes one columnar file per table.
+
+Columns and types follow the SQLite schema, so the Parquet tables mirror
+filaments.db (JSON fields are stored as JSON text, booleans as 0/1).
+Requires the optional pyarrow package; the export is skipped without it.
+"""
+
+import sqlite3
+from pathlib import Path
+
+from ..models import Database
+from ..serialization import entity_to_dict, serialize_for_sqlite
+from .sqlite_exporter import SCHEMA_DDL
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional, only needed for the Parquet export
+    pa = None
+    pq = None
+
+
+def _table_columns() -> dict[str, list[tuple[str, str]]]:
+    """Read (column name, declared type) per table from the SQLite schema DDL."""
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.executescript(SCHEMA_DDL)
+        tables = [
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name != 'meta'"
+            )
+        ]
+        return {
+            table: [(row[1], row[2].upper()) for row in conn.execute(f"PRAGMA table_info({table})")]
+            for table in tables
+        }
+    finally:
+        conn.close()
+
+
+def _column_array(values: list, declared_type: str):
+    """
+    Build an Arrow array for one column, following SQLite type affinity.
+
+    INTEGER/REAL columns holding values SQLite would have stored as a
+    different type (e.g. a fractional number in an INTEGER column) widen
+    to float64 or string rather than losing data.
+    """
+    present = [v for v in values if v is not None]
+    if declared_type in ("INTEGER", "REAL"):
+        if declared_type == "INTEGER" and all(type(v) is int for v in present):
+            return pa.array(values, type=pa.int64())
+        if all(type(v) in (int, float) for v in present):
+            return pa.array(values, type=pa.float64())
+    return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+
+def _export_entity_parquet(
+    entities: list[dict],
+    columns: list[tuple[str, str]],
+    parquet_path: Path,
+    metadata: dict[str, str],
+) -> Path:
+    """Write a list of dict entities to a Parquet file, one Arrow array per column."""
+    rows = [entity_to_dict(entity) for entity in entities]
+    arrays = [
+        _column_array([serialize_for_sqlite(row.get(name)) for row in rows], declared_type)
+        for name, declared_type in columns
+    ]
+    table = pa.Table.from_arrays(arrays, names=[name for name, _ in columns], metadata=metadata)
+    pq.write_table(table, parquet_path, compression="zstd")
+    return parquet_path
+
+
+def export_parquet(db: Database, output_dir: str, version: str, generated_at: str):
+    """Export database tables to Parquet files."""
+    if pa is None:
+        print("  Skipping Parquet export: pyarrow is not installed (pip install pyarrow)")
+        return
+
+    output_path = Path(output_dir) / "parquet"
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    table_columns = _table_columns()
+    metadata = {"dataset_version": version, "generated_at": generated_at}
+    exports = [
+        (db.brands, "brand", "brands.parquet"),
+        (db.materials, "material", "materials.parquet"),
+        (db.filaments, "filament", "filaments.parquet"),
+        (db.variants, "variant", "variants.parquet"),
+        (db.sizes, "size", "sizes.parquet"),
+        (db.stores, "store", "stores.parquet"),
+        (db.purchase_links, "purchase_link", "purchase_links.parquet"),
+    ]
+
+    for entities, table_name, filename in exports:
+        parquet_path = _export_entity_parquet(
+            entities, table_columns[table_name], output_path / filename, metadata
+        )
+        print(f"  Written: {parquet_path}")
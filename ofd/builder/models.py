@@ -21,6 +21,18 @@ class DocumentType(str, Enum):
 ENTITY_TYPES = ("brand", "material", "filament", "variant", "size", "store", "purchase_link")
 
 
+@dataclass
+class DatabaseIndex:
+    """Child entities grouped by parent ID, in database order."""
+
+    materials_by_brand: dict[str, list[dict]] = field(default_factory=dict)
+    filaments_by_brand: dict[str, list[dict]] = field(default_factory=dict)
+    filaments_by_material: dict[str, list[dict]] = field(default_factory=dict)
+    variants_by_filament: dict[str, list[dict]] = field(default_factory=dict)
+    sizes_by_variant: dict[str, list[dict]] = field(default_factory=dict)
+    purchase_links_by_size: dict[str, list[dict]] = field(default_factory=dict)
+
+
 @dataclass
 class Database:
     """Container for all database entities. Each entity is a plain dict."""
@@ -33,6 +45,22 @@ class Database:
     stores: list[dict] = field(default_factory=list)
     purchase_links: list[dict] = field(default_factory=list)
 
+    def index(self) -> DatabaseIndex:
+        """Group child entities by parent ID in a single pass over each list."""
+        idx = DatabaseIndex()
+        for m in self.materials:
+            idx.materials_by_brand.setdefault(m["brand_id"], []).append(m)
+        for f in self.filaments:
+            idx.filaments_by_brand.setdefault(f["brand_id"], []).append(f)
+            idx.filaments_by_material.setdefault(f["material_id"], []).append(f)
+        for v in self.variants:
+            idx.variants_by_filament.setdefault(v["filament_id"], []).append(v)
+        for s in self.sizes:
+            idx.sizes_by_variant.setdefault(s["variant_id"], []).append(s)
+        for pl in self.purchase_links:
+            idx.purchase_links_by_size.setdefault(pl["size_id"], []).append(pl)
+        return idx
+
     def get_brand(self, brand_id: str) -> dict | None:
         """Get brand by ID."""
         for brand in self.brands:
@@ -10,6 +10,9 @@ from typing import Any
 
 from ofd.builder.models import ENTITY_TYPES
 
+# Keys renamed on export for brands and stores
+_BRAND_STORE_KEY_RENAMES = {"logo": "logo_name"}
+
 
 def entity_to_dict(entity: Any, exclude_none: bool = True) -> dict | None:
     """
@@ -24,8 +27,12 @@ def entity_to_dict(entity: Any, exclude_none: bool = True) -> dict | None:
     if not isinstance(entity, dict):
         return entity
 
-    # Detect brand/store by presence of directory_name (only those entity types have it)
-    is_brand_or_store = "directory_name" in entity
+    # Detect brand/store by presence of directory_name (only those entity types have it).
+    # Everything else needs no key rewriting, so copy it in a single comprehension.
+    if "directory_name" not in entity:
+        if exclude_none:
+            return {key: value for key, value in entity.items() if value is not None}
+        return dict(entity)
 
     result = {}
     for key, value in entity.items():
@@ -34,9 +41,7 @@ def entity_to_dict(entity: Any, exclude_none: bool = True) -> dict | None:
             continue
 
         # Rename logo -> logo_name for brands and stores
-        output_key = key
-        if key == "logo" and is_brand_or_store:
-            output_key = "logo_name"
+        output_key = _BRAND_STORE_KEY_RENAMES.get(key, key)
 
         if value is not None or not exclude_none:
             result[output_key] = value
@@ -97,7 +102,9 @@ def insert_entities(
     col_names = ", ".join(columns)
     sql = f"INSERT INTO {table_name} ({col_names}) VALUES ({placeholders})"
 
-    for entity in entities:
-        exported = entity_to_dict(entity)
-        values = tuple(serialize_for_sqlite(exported.get(col)) for col in columns)
-        cursor.execute(sql, values)
+    def rows():
+        for entity in entities:
+            exported = entity_to_dict(entity)
+            yield tuple(serialize_for_sqlite(exported.get(col)) for col in columns)
+
+    cursor.executemany(sql, rows())
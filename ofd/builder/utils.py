@@ -8,10 +8,26 @@ UUID Generation follows the OFD standard specification:
 """
 
 import hashlib
+import json
+import mmap
+import os
 import re
 import subprocess
+import sys
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
+
+try:
+    import blake3
+except ImportError:  # optional, only needed for --hash-algo blake3
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # optional speedup, the stdlib json module is used otherwise
+    orjson = None
 
 # =============================================================================
 # UUID Namespaces (from OPT specification)
@@ -39,9 +55,9 @@ NAMESPACE_PURCHASE_LINK = uuid.UUID("e5f6a7b8-c9d0-8e9f-2a3b-4c5d6e7f8a9b")
 # =============================================================================
 
 
-def _derive_uuid(namespace: uuid.UUID, *args: bytes | str | uuid.UUID) -> uuid.UUID:
+def _derive_uuid_bytes(namespace: uuid.UUID, *args: bytes | str | uuid.UUID) -> bytes:
     """
-    Derive a UUID using the OFD standard algorithm.
+    Derive the 16 raw bytes of a UUID using the OFD standard algorithm.
 
     Uses UUIDv5 with SHA1 hash as specified in RFC 4122, section 4.3.
 
@@ -53,7 +69,7 @@ def _derive_uuid(namespace: uuid.UUID, *args: bytes | str | uuid.UUID) -> uuid.U
             - uuid.UUID: Used as bytes (binary form)
 
     Returns:
-        Derived UUID
+        Derived UUID bytes with the version and variant bits set
     """
     # Build the name by concatenating all args
     parts = []
@@ -71,8 +87,38 @@ def _derive_uuid(namespace: uuid.UUID, *args: bytes | str | uuid.UUID) -> uuid.U
     name = b"".join(parts)
     # uuid.uuid5 expects a string, but we have bytes from concatenation
     # We need to use the underlying implementation directly
-    hash_value = hashlib.sha1(namespace.bytes + name).digest()
-    return uuid.UUID(bytes=hash_value[:16], version=5)
+    digest = bytearray(hashlib.sha1(namespace.bytes + name).digest()[:16])
+    digest[6] = (digest[6] & 0x0F) | 0x50  # version 5
+    digest[8] = (digest[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return bytes(digest)
+
+
+def _derive_uuid_str(namespace: uuid.UUID, *args: bytes | str | uuid.UUID) -> str:
+    """
+    Derive a UUID in canonical string form using the OFD standard algorithm.
+
+    Formats the hex digest directly, skipping uuid.UUID construction.
+    """
+    h = _derive_uuid_bytes(namespace, *args).hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
+
+@lru_cache(maxsize=8192)
+def _uuid_bytes(value: str) -> bytes:
+    """
+    Parse a UUID string into its 16-byte binary form.
+
+    Parent IDs repeat for every child derived from them (each size of a
+    variant, each purchase link of a store), so parsing is cached.
+    """
+    return uuid.UUID(value).bytes
+
+
+def _as_uuid_bytes(value: str | uuid.UUID) -> bytes:
+    """Return the binary form of a UUID given as a string or UUID object."""
+    if isinstance(value, uuid.UUID):
+        return value.bytes
+    return _uuid_bytes(value)
 
 
 def generate_brand_uuid(brand_name: str) -> str:
@@ -85,7 +131,7 @@ def generate_brand_uuid(brand_name: str) -> str:
         >>> generate_brand_uuid("Prusament")
         'ae5ff34e-298e-50c9-8f77-92a97fb30b09'
     """
-    return str(_derive_uuid(NAMESPACE_BRAND, brand_name))
+    return _derive_uuid_str(NAMESPACE_BRAND, brand_name)
 
 
 def generate_material_uuid(brand_uuid: str | uuid.UUID, material_name: str) -> str:
@@ -99,9 +145,7 @@ def generate_material_uuid(brand_uuid: str | uuid.UUID, material_name: str) -> s
         >>> generate_material_uuid(brand_uuid, "PLA Prusa Galaxy Black")
         '1aaca54a-431f-5601-adf5-85dd018f487f'
     """
-    if isinstance(brand_uuid, str):
-        brand_uuid = uuid.UUID(brand_uuid)
-    return str(_derive_uuid(NAMESPACE_MATERIAL, brand_uuid, material_name))
+    return _derive_uuid_str(NAMESPACE_MATERIAL, _as_uuid_bytes(brand_uuid), material_name)
 
 
 def generate_package_uuid(brand_uuid: str | uuid.UUID, gtin: str) -> str:
@@ -115,9 +159,7 @@ def generate_package_uuid(brand_uuid: str | uuid.UUID, gtin: str) -> str:
         >>> generate_package_uuid(brand_uuid, "1234")
         '7ed3ce83-764d-56de-bdcd-dc5226a0efd1'
     """
-    if isinstance(brand_uuid, str):
-        brand_uuid = uuid.UUID(brand_uuid)
-    return str(_derive_uuid(NAMESPACE_PACKAGE, brand_uuid, gtin))
+    return _derive_uuid_str(NAMESPACE_PACKAGE, _as_uuid_bytes(brand_uuid), gtin)
 
 
 def generate_instance_uuid(nfc_tag_uid: bytes) -> str:
@@ -134,7 +176,7 @@ def generate_instance_uuid(nfc_tag_uid: bytes) -> str:
         >>> generate_instance_uuid(nfc_tag_uid)
         'bf63e92d-9ca5-53d7-9fab-ffdd0240c585'
     """
-    return str(_derive_uuid(NAMESPACE_INSTANCE, nfc_tag_uid))
+    return _derive_uuid_str(NAMESPACE_INSTANCE, nfc_tag_uid)
 
 
 # =============================================================================
@@ -162,9 +204,9 @@ def generate_filament_id(brand_id: str, material_id: str, filament_name: str) ->
 
     Formula: NAMESPACE_FILAMENT + brand_uuid (bytes) + material_uuid (bytes) + filament_name (UTF-8)
     """
-    brand_uuid = uuid.UUID(brand_id)
-    material_uuid = uuid.UUID(material_id)
-    return str(_derive_uuid(NAMESPACE_FILAMENT, brand_uuid, material_uuid, filament_name))
+    return _derive_uuid_str(
+        NAMESPACE_FILAMENT, _uuid_bytes(brand_id), _uuid_bytes(material_id), filament_name
+    )
 
 
 def generate_variant_id(filament_id: str, color_name: str) -> str:
@@ -173,8 +215,7 @@ def generate_variant_id(filament_id: str, color_name: str) -> str:
 
     Formula: NAMESPACE_VARIANT + filament_uuid (bytes) + color_name (UTF-8)
     """
-    filament_uuid = uuid.UUID(filament_id)
-    return str(_derive_uuid(NAMESPACE_VARIANT, filament_uuid, color_name))
+    return _derive_uuid_str(NAMESPACE_VARIANT, _uuid_bytes(filament_id), color_name)
 
 
 def generate_size_id(variant_id: str, size_entry: dict, index: int = 0) -> str:
@@ -194,7 +235,7 @@ def generate_size_id(variant_id: str, size_entry: dict, index: int = 0) -> str:
     """
     weight = size_entry.get("filament_weight")
     diameter = size_entry.get("diameter", 1.75)
-    variant_uuid = uuid.UUID(variant_id)
+    variant_uuid = _uuid_bytes(variant_id)
 
     # Build ID components from multiple distinguishing fields
     id_parts = [f"{weight}g", f"{diameter}mm"]
@@ -218,7 +259,7 @@ def generate_size_id(variant_id: str, size_entry: dict, index: int = 0) -> str:
 
     # Join all parts with underscores
     id_str = "_".join(id_parts)
-    return str(_derive_uuid(NAMESPACE_SIZE, variant_uuid, id_str))
+    return _derive_uuid_str(NAMESPACE_SIZE, variant_uuid, id_str)
 
 
 def generate_store_id(store_slug: str) -> str:
@@ -227,7 +268,7 @@ def generate_store_id(store_slug: str) -> str:
 
     Formula: NAMESPACE_STORE + store_slug (UTF-8)
     """
-    return str(_derive_uuid(NAMESPACE_STORE, store_slug))
+    return _derive_uuid_str(NAMESPACE_STORE, store_slug)
 
 
 def generate_purchase_link_id(size_id: str, store_id: str, url: str) -> str:
@@ -236,9 +277,9 @@ def generate_purchase_link_id(size_id: str, store_id: str, url: str) -> str:
 
     Formula: NAMESPACE_PURCHASE_LINK + size_uuid (bytes) + store_uuid (bytes) + url (UTF-8)
     """
-    size_uuid = uuid.UUID(size_id)
-    store_uuid = uuid.UUID(store_id)
-    return str(_derive_uuid(NAMESPACE_PURCHASE_LINK, size_uuid, store_uuid, url))
+    return _derive_uuid_str(
+        NAMESPACE_PURCHASE_LINK, _uuid_bytes(size_id), _uuid_bytes(store_id), url
+    )
 
 
 # =============================================================================
@@ -246,6 +287,11 @@ def generate_purchase_link_id(size_id: str, store_id: str, url: str) -> str:
 # =============================================================================
 
 
+_SLUG_SEPARATORS_RE = re.compile(r"[\s\-]+")
+_SLUG_INVALID_RE = re.compile(r"[^a-z0-9_+]")
+_SLUG_UNDERSCORES_RE = re.compile(r"_+")
+
+
 def slugify(text: str) -> str:
     """Convert text to a slug that matches the schema id pattern: ^[a-z0-9+]+(_[a-z0-9+]+)*$
 
@@ -255,16 +301,20 @@ def slugify(text: str) -> str:
     # Convert to lowercase
     text = text.lower()
     # Replace spaces and hyphens with underscores
-    text = re.sub(r"[\s\-]+", "_", text)
+    text = _SLUG_SEPARATORS_RE.sub("_", text)
     # Remove non-alphanumeric characters except underscores and plus
-    text = re.sub(r"[^a-z0-9_+]", "", text)
+    text = _SLUG_INVALID_RE.sub("", text)
     # Remove consecutive underscores
-    text = re.sub(r"_+", "_", text)
+    text = _SLUG_UNDERSCORES_RE.sub("_", text)
     # Strip leading/trailing underscores
     text = text.strip("_")
     return text
 
 
+# Bound once so each call skips re's pattern cache lookup
+_match_hex_color = re.compile(r"#?([0-9A-Fa-f]{6}|[0-9A-Fa-f]{3})").fullmatch
+
+
 def normalize_color_hex(color: str) -> str | None:
     """Normalize a color value to #RRGGBB format."""
     if not color:
@@ -279,22 +329,13 @@ def normalize_color_hex(color: str) -> str | None:
     # Remove any whitespace
     color = str(color).strip()
 
-    # If already in correct format, return as-is
-    if re.match(r"^#[0-9A-Fa-f]{6}$", color):
-        return color.upper()
-
-    # Handle 3-digit hex
-    if re.match(r"^#[0-9A-Fa-f]{3}$", color):
-        r, g, b = color[1], color[2], color[3]
-        return f"#{r}{r}{g}{g}{b}{b}".upper()
-
-    # Handle hex without #
-    if re.match(r"^[0-9A-Fa-f]{6}$", color):
-        return f"#{color}".upper()
-
-    if re.match(r"^[0-9A-Fa-f]{3}$", color):
-        r, g, b = color[0], color[1], color[2]
-        return f"#{r}{r}{g}{g}{b}{b}".upper()
+    # Accept #RRGGBB, #RGB, RRGGBB and RGB
+    match = _match_hex_color(color)
+    if match:
+        digits = match.group(1)
+        if len(digits) == 3:
+            digits = "".join(c * 2 for c in digits)
+        return f"#{digits}".upper()
 
     # Return as-is if we can't parse it
     return color
@@ -327,13 +368,101 @@ def get_git_commit() -> str | None:
 
 def calculate_sha256(data: bytes) -> str:
     """Calculate SHA256 hash of data."""
-    return hashlib.sha256(data).hexdigest()
+    return hashlib.sha256(data, usedforsecurity=False).hexdigest()
+
+
+# Chunk size used when streaming files through a hash on Python < 3.11
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Files at least this large are memory-mapped and hashed in one call
+_HASH_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+
+# Algorithms accepted by calculate_file_digest; checksums are for integrity
+# and change detection only, never authentication
+HASH_ALGORITHMS = ("sha256", "blake3")
+
+
+def _new_sha256():
+    return hashlib.sha256(usedforsecurity=False)
 
 
 def calculate_file_sha256(filepath: str) -> str:
-    """Calculate SHA256 hash of a file."""
+    """
+    Calculate SHA256 hash of a file, streaming it rather than reading it whole.
+
+    Large files (SQLite databases, all.json) are memory-mapped so the hash
+    reads straight from the page cache, with sequential readahead requested.
+    """
     with open(filepath, "rb") as f:
-        return hashlib.sha256(f.read()).hexdigest()
+        if os.fstat(f.fileno()).st_size >= _HASH_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return hashlib.sha256(mm, usedforsecurity=False).hexdigest()
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, _new_sha256).hexdigest()
+        h = _new_sha256()
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def calculate_file_blake3(filepath: str) -> str:
+    """Calculate BLAKE3 hash of a file using the package's memory-mapped, multithreaded path."""
+    if blake3 is None:
+        raise RuntimeError("BLAKE3 hashing requires the 'blake3' package (pip install blake3)")
+    h = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    h.update_mmap(filepath)
+    return h.hexdigest()
+
+
+def calculate_file_digest(filepath: str, algo: str = "sha256") -> str:
+    """Calculate the hex digest of a file with one of HASH_ALGORITHMS."""
+    if algo == "sha256":
+        return calculate_file_sha256(filepath)
+    if algo == "blake3":
+        return calculate_file_blake3(filepath)
+    raise ValueError(f"Unsupported hash algorithm: {algo}")
+
+
+# =============================================================================
+# JSON Utilities
+# =============================================================================
+
+
+# Digit runs long enough to hold an integer outside the 64-bit range, which
+# orjson reads as a lossy float instead of rejecting
+_DIGITS_TO_ZERO = bytes.maketrans(b"0123456789", b"0" * 10)
+_LONG_DIGIT_RUN = b"0" * 19
+
+
+def loads_json(raw: bytes) -> Any:
+    """
+    Parse UTF-8 JSON bytes, with orjson when it is installed.
+
+    The result always matches json.loads. Input that may hold an integer
+    outside the 64-bit range goes straight to the stdlib, and input orjson
+    rejects (such as NaN/Infinity) is parsed again by it, which otherwise
+    raises the usual json.JSONDecodeError.
+    """
+    if orjson is not None and _LONG_DIGIT_RUN not in raw.translate(_DIGITS_TO_ZERO):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize data to UTF-8 JSON indented by two spaces.
+
+    Always uses the stdlib encoder: published files and their manifest digests
+    must not depend on which optional JSON library is installed (orjson formats
+    floats such as 1e-05 differently and cannot encode integers wider than 64 bits).
+    """
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
 
 # =============================================================================
@@ -343,6 +472,9 @@ def calculate_file_sha256(filepath: str) -> str:
 
 def ensure_list(value) -> list:
     """Ensure a value is a list."""
+    # Most callers already pass a list, so check for that first
+    if type(value) is list:
+        return value
     if value is None:
         return []
     if isinstance(value, list):
@@ -2,29 +2,29 @@
 Build command - Builds database exports.
 
 This command wraps the builder module functionality to generate
-JSON, SQLite, CSV, API, and HTML exports.
+JSON, SQLite, CSV, Parquet, API, and HTML exports.
 """
 
 import argparse
 import hashlib
 import json
+import os
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from multiprocessing import shared_memory
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from ofd.builder.crawler import crawl_data
-from ofd.builder.errors import BuildResult
-from ofd.builder.exporters import (
-    export_api,
-    export_badges,
-    export_csv,
-    export_directory_listings,
-    export_html,
-    export_json,
-    export_sqlite,
-    export_sqlite_stores,
-)
-from ofd.builder.utils import get_current_timestamp, get_git_commit
+# Only lightweight builder modules are imported here; the crawler and
+# exporters (sqlite3, jinja2, ...) are imported by run_build so other
+# commands and --help start quickly
+from ofd.builder import utils
+from ofd.builder.utils import HASH_ALGORITHMS, calculate_file_digest
+
+if TYPE_CHECKING:
+    from ofd.builder.models import Database
 
 project_root = Path(__file__).parent.parent.parent
 
@@ -35,40 +35,316 @@ def generate_version() -> str:
     return now.strftime("%Y.%m.%d")
 
 
-def calculate_checksums(output_dir: str) -> dict[str, str]:
-    """Calculate SHA256 checksums for all generated files."""
-    checksums = {}
-    output_path = Path(output_dir)
+# Database loaded once by each export worker process (see _init_export_worker)
+_worker_db: "Database | None" = None
+
+
+def _init_export_worker(shm_name: str, size: int) -> None:
+    """Process pool initializer: unpickle the database from shared memory."""
+    global _worker_db
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        with shm.buf[:size] as view:
+            _worker_db = pickle.loads(view)
+    finally:
+        shm.close()
 
-    for file_path in output_path.rglob("*"):
-        if file_path.is_file() and not file_path.name.endswith(".sha256"):
-            rel_path = str(file_path.relative_to(output_path))
-            with open(file_path, "rb") as f:
-                sha256 = hashlib.sha256(f.read()).hexdigest()
-            checksums[rel_path] = sha256
 
-    return checksums
+def _run_export_step(exporter, kwargs: dict) -> None:
+    """Run a single exporter in a worker process."""
+    exporter(_worker_db, **kwargs)
+    # Workers share the parent's stdout but exit without flushing Python's
+    # stdout buffer, so flush after each step or its progress lines are lost
+    sys.stdout.flush()
+
+
+def run_export_steps(db: "Database", steps: list[tuple[str, object, dict]]) -> None:
+    """
+    Run independent export steps concurrently in a process pool.
 
+    Each step writes to its own output subtree, so they do not depend on each
+    other. The database is pickled once into a shared memory block that every
+    worker unpickles a single time when it starts.
 
-def write_manifest(output_dir: str, version: str, generated_at: str, checksums: dict[str, str]):
-    """Write the manifest file with all artifacts."""
+    Args:
+        db: The crawled database
+        steps: List of (label, exporter, kwargs) tuples; exporters are called
+            as exporter(db, **kwargs)
+    """
+    if not steps:
+        return
+
+    blob = pickle.dumps(db, protocol=pickle.HIGHEST_PROTOCOL)
+    size = len(blob)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        shm.buf[:size] = blob
+        del blob
+
+        max_workers = min(len(steps), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_export_worker,
+            initargs=(shm.name, size),
+        ) as executor:
+            futures = {
+                executor.submit(_run_export_step, exporter, kwargs): label
+                for label, exporter, kwargs in steps
+            }
+            for future in as_completed(futures):
+                # Re-raise any exporter failure in the parent
+                future.result()
+                print(f"  Finished: {futures[future]}")
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# Build caches live outside the output directory, which is published as is
+CACHE_DIR = project_root / ".ofd_cache"
+# Sidecar cache of artifact digests, keyed by path and validated by size/mtime
+MANIFEST_CACHE_NAME = "manifest_cache"
+# Per-step input fingerprints and the timestamp of the previous build
+BUILD_STATE_NAME = "build_state"
+# Written into the output directory by older builds; removed when found
+LEGACY_CACHE_FILES = (".manifest.cache.json", ".build_state.json")
+
+# Outputs that must still exist for an export step to be considered up to date
+_STEP_OUTPUTS = {
+    "json": ["json/all.json", "json/all.ndjson", "json/brands/index.json"],
+    "sqlite": ["sqlite/filaments.db", "sqlite/filaments.db.xz"],
+    "sqlite_stores": ["sqlite/stores.db", "sqlite/stores.db.xz"],
+    "csv": ["csv/brands.csv", "csv/purchase_links.csv"],
+    "api": ["api/v1/index.json", "api/v1/brands/index.json", "api/v1/stores/index.json"],
+    "html": ["index.html"],
+    "badges": ["api/v1/badges/brands.svg"],
+    "parquet": ["parquet/brands.parquet", "parquet/purchase_links.parquet"],
+}
+
+
+def _load_json_object(path: Path) -> dict:
+    """Load a JSON object left by a previous build, or an empty dict."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def cache_path_for(name: str, output_dir: Path) -> Path:
+    """Cache file for one output directory, e.g. .ofd_cache/manifest_cache-<hash>.json."""
+    key = hashlib.sha256(str(output_dir.resolve()).encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{name}-{key}.json"
+
+
+def _fingerprint_tree(root: Path) -> str:
+    """Hash the relative path and content of every file under root (or of root itself)."""
+    h = hashlib.sha256()
+    if root.is_file():
+        h.update(f"{root.name}\0".encode())
+        h.update(hashlib.sha256(root.read_bytes()).digest())
+        return h.hexdigest()
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            with open(path, "rb") as f:
+                content_digest = hashlib.sha256(f.read()).digest()
+            h.update(f"{os.path.relpath(path, root)}\0".encode())
+            h.update(content_digest)
+    return h.hexdigest()
+
+
+class BuildState:
+    """
+    Tracks what each export step was built from, so unchanged steps can be skipped.
+
+    A step's key covers the content of its input files and every argument
+    passed to its exporter, including version, generated_at and commit. The
+    previous build's generated_at is reused when no input, the version or the
+    commit changed: a rebuild without changes then skips every step, and the
+    manifest keeps the timestamp embedded in the artifacts. Any change yields
+    a fresh timestamp, which rebuilds every step that embeds it, so artifacts
+    of one build never carry different timestamps.
+
+    The state is kept in CACHE_DIR, never in the published output directory.
+    """
+
+    def __init__(self, path: Path, output_dir: Path, force: bool = False):
+        self.path = path
+        self.output_dir = output_dir
+        previous = {} if force else _load_json_object(path)
+        steps = previous.get("steps")
+        self.previous_steps: dict[str, str] = steps if isinstance(steps, dict) else {}
+        self.previous_inputs = previous.get("inputs")
+        self.previous_generated_at = previous.get("generated_at")
+        self.steps: dict[str, str] = {}
+        self.inputs: str | None = None
+        self.generated_at: str | None = None
+        self._tree_fingerprints: dict[Path, str] = {}
+
+    def _fingerprint(self, inputs: list[Path], extra: tuple) -> str:
+        h = hashlib.sha256()
+        h.update(repr(extra).encode())
+        for root in inputs:
+            if root not in self._tree_fingerprints:
+                self._tree_fingerprints[root] = _fingerprint_tree(root)
+            h.update(self._tree_fingerprints[root].encode())
+        return h.hexdigest()
+
+    def resolve_generated_at(self, inputs: list[Path], extra: tuple, now: str) -> str:
+        """Return the previous build's timestamp if inputs and extra are unchanged, else now."""
+        self.inputs = self._fingerprint(inputs, extra)
+        if self.inputs == self.previous_inputs and isinstance(self.previous_generated_at, str):
+            self.generated_at = self.previous_generated_at
+        else:
+            self.generated_at = now
+        return self.generated_at
+
+    @property
+    def reused_generated_at(self) -> bool:
+        return self.generated_at is not None and self.generated_at == self.previous_generated_at
+
+    def is_up_to_date(self, step: str, inputs: list[Path], kwargs: dict) -> bool:
+        """Record the step's key and report whether it can be skipped."""
+        key = self._fingerprint(inputs, tuple(sorted(kwargs.items())))
+        self.steps[step] = key
+        return self.previous_steps.get(step) == key and all(
+            (self.output_dir / output).exists() for output in _STEP_OUTPUTS[step]
+        )
+
+    def save(self) -> None:
+        """Persist the state; call only after all export steps succeeded."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "inputs": self.inputs,
+            "generated_at": self.generated_at,
+            "steps": {**self.previous_steps, **self.steps},
+        }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+
+
+def _walk_files(root: str):
+    """
+    Yield (relative path, DirEntry) for every file under root.
+
+    Uses os.scandir so file types come from the directory listing and each
+    entry caches its own stat result, avoiding the extra syscalls of
+    Path.rglob() + is_file().
+    """
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(os.path.join(root, rel_dir)) as it:
+            for entry in it:
+                rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(rel_path)
+                elif entry.is_file():
+                    yield rel_path, entry
+
+
+def calculate_checksums(
+    output_dir: str, algo: str = "sha256", cache_path: Path | None = None
+) -> list[tuple[str, str, int]]:
+    """
+    Calculate checksums for all generated files.
+
+    Returns (relative path, hex digest, size in bytes) tuples sorted by path.
+
+    Digests from the previous build are reused for files whose size and
+    mtime are unchanged; only new or modified files are rehashed. The digest
+    cache is kept in CACHE_DIR (or at cache_path), never in the output
+    directory.
+    """
     output_path = Path(output_dir)
+    for name in LEGACY_CACHE_FILES:
+        (output_path / name).unlink(missing_ok=True)
+
+    if cache_path is None:
+        cache_path = cache_path_for(MANIFEST_CACHE_NAME, output_path)
+    cached_state = _load_json_object(cache_path)
+    # Digests computed with a different algorithm are useless, start over
+    cache = cached_state.get("files", {}) if cached_state.get("algo") == algo else {}
+
+    new_cache: dict[str, list] = {}
+    to_hash: list[tuple[str, str]] = []
+    for rel_path, entry in _walk_files(output_dir):
+        if entry.name.endswith(".sha256"):
+            continue
+        st = entry.stat()
+        cached = cache.get(rel_path)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            new_cache[rel_path] = cached
+        else:
+            new_cache[rel_path] = [st.st_size, st.st_mtime_ns, None]
+            to_hash.append((rel_path, entry.path))
+
+    # hashlib and blake3 release the GIL while hashing, so threads overlap IO and hashing
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        digests = executor.map(
+            lambda path: calculate_file_digest(path, algo), (path for _, path in to_hash)
+        )
+        for (rel_path, _), digest in zip(to_hash, digests, strict=True):
+            new_cache[rel_path][2] = digest
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump({"algo": algo, "files": new_cache}, f)
+
+    # Sort the path strings once instead of comparing (path, digest, size) tuples
+    return [
+        (rel_path, new_cache[rel_path][2], new_cache[rel_path][0]) for rel_path in sorted(new_cache)
+    ]
+
+
+def write_manifest(
+    output_dir: str,
+    version: str,
+    generated_at: str,
+    artifacts: list[tuple[str, str, int]],
+    algo: str = "sha256",
+):
+    """
+    Write the manifest file from the sorted (path, digest, size) artifacts of calculate_checksums.
 
-    artifacts = []
-    for rel_path, sha256 in sorted(checksums.items()):
-        file_path = output_path / rel_path
-        artifacts.append({"path": rel_path, "sha256": sha256, "size": file_path.stat().st_size})
+    Each artifact's digest is stored under the algorithm's name ("sha256" or
+    "blake3"), and the manifest's "algo" field names the algorithm used.
+    """
+    output_path = Path(output_dir)
 
-    manifest = {
-        "dataset_version": version,
-        "generated_at": generated_at,
-        "artifact_count": len(artifacts),
-        "artifacts": artifacts,
-    }
+    # Stream artifact entries straight to the file rather than building the
+    # whole manifest tree first; the layout matches a 2-space indented dump
+    def encode(value) -> str:
+        return json.dumps(value, ensure_ascii=False)
+
+    digest_key = encode(algo)
+    header = (
+        "{\n"
+        f'  "dataset_version": {encode(version)},\n'
+        f'  "generated_at": {encode(generated_at)},\n'
+        f'  "algo": {digest_key},\n'
+        f'  "artifact_count": {len(artifacts)},\n'
+        '  "artifacts": ['
+    )
 
     manifest_file = output_path / "manifest.json"
     with open(manifest_file, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
+        f.write(header)
+        separator = "\n"
+        for rel_path, digest, size in artifacts:
+            f.write(
+                f"{separator}    {{\n"
+                f'      "path": {encode(rel_path)},\n'
+                f"      {digest_key}: {encode(digest)},\n"
+                f'      "size": {size}\n'
+                "    }"
+            )
+            separator = ",\n"
+        f.write("\n  ]\n}" if artifacts else "]\n}")
 
     print(f"Written: {manifest_file}")
     return manifest_file
@@ -78,7 +354,7 @@ def register_subcommand(subparsers: argparse._SubParsersAction) -> None:
     """Register the build subcommand."""
     parser = subparsers.add_parser(
         "build",
-        help="Build database exports (JSON, SQLite, CSV, API, HTML)",
+        help="Build database exports (JSON, SQLite, CSV, Parquet, API, HTML)",
         description="Build all database exports from the data and stores directories.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -87,6 +363,8 @@ Examples:
   ofd build -o output              Build to custom output directory
   ofd build --skip-sqlite          Skip SQLite export
   ofd build --skip-json --skip-csv Only build API and HTML
+  ofd build --force                Rebuild every export even if inputs are unchanged
+  ofd build --hash-algo blake3     Checksum artifacts with BLAKE3 (needs the blake3 package)
         """,
     )
 
@@ -106,11 +384,26 @@ Examples:
         "--version", "-v", default=None, help="Dataset version (default: auto-generated from date)"
     )
 
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild all exports, even those whose inputs are unchanged since the last build",
+    )
+    parser.add_argument(
+        "--hash-algo",
+        choices=HASH_ALGORITHMS,
+        default="sha256",
+        help="Checksum algorithm for the artifact manifest (default: sha256)",
+    )
+
     # Skip options
     skip_group = parser.add_argument_group("skip options")
     skip_group.add_argument("--skip-json", action="store_true", help="Skip JSON export")
     skip_group.add_argument("--skip-sqlite", action="store_true", help="Skip SQLite export")
     skip_group.add_argument("--skip-csv", action="store_true", help="Skip CSV export")
+    skip_group.add_argument(
+        "--skip-parquet", action="store_true", help="Skip Parquet export (needs pyarrow)"
+    )
     skip_group.add_argument("--skip-api", action="store_true", help="Skip static API export")
     skip_group.add_argument(
         "--skip-html", action="store_true", help="Skip HTML landing page export"
@@ -129,6 +422,22 @@ def run_build(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for errors)
     """
+    from ofd.builder.crawler import crawl_data
+    from ofd.builder.errors import BuildResult
+    from ofd.builder.exporters import (
+        export_api,
+        export_badges,
+        export_csv,
+        export_directory_listings,
+        export_html,
+        export_json,
+        export_parquet,
+        export_sqlite,
+        export_sqlite_stores,
+        parquet_exporter,
+    )
+    from ofd.builder.utils import get_current_timestamp, get_git_commit
+
     # Resolve paths
     data_dir = project_root / args.data_dir
     stores_dir = project_root / args.stores_dir
@@ -143,12 +452,27 @@ def run_build(args: argparse.Namespace) -> int:
     if not stores_dir.exists():
         print(f"Error: Stores directory '{stores_dir}' does not exist", file=sys.stderr)
         return 1
+    if args.hash_algo == "blake3" and utils.blake3 is None:
+        print(
+            "Error: --hash-algo blake3 requires the 'blake3' package (pip install blake3)",
+            file=sys.stderr,
+        )
+        return 1
 
     # Generate version if not provided
     version = args.version or generate_version()
-    generated_at = get_current_timestamp()
     commit = get_git_commit()
 
+    templates_dir = Path(__file__).parent.parent / "builder" / "templates"
+    config_dir = project_root / "config"
+    # Exporter code and templates are inputs too, so code changes trigger rebuilds
+    source_inputs = [data_dir, stores_dir, Path(__file__).parent.parent / "builder"]
+
+    state = BuildState(cache_path_for(BUILD_STATE_NAME, output_dir), output_dir, force=args.force)
+    generated_at = state.resolve_generated_at(
+        [*source_inputs, schemas_dir, config_dir], (version, commit), get_current_timestamp()
+    )
+
     print("=" * 60)
     print("Open Filament Database Builder")
     print("=" * 60)
@@ -156,6 +480,8 @@ def run_build(args: argparse.Namespace) -> int:
     if commit:
         print(f"Commit: {commit[:12]}")
     print(f"Generated at: {generated_at}")
+    if state.reused_generated_at:
+        print("  (inputs unchanged since the previous build)")
     print(f"Data directory: {data_dir}")
     print(f"Stores directory: {stores_dir}")
     print(f"Output directory: {output_dir}")
@@ -168,80 +494,122 @@ def run_build(args: argparse.Namespace) -> int:
     build_result = BuildResult()
 
     # Step 1: Crawl data
-    print("\n[1/9] Crawling data...")
+    print("\n[1/10] Crawling data...")
     db, crawl_result = crawl_data(str(data_dir), str(stores_dir))
     build_result.merge(crawl_result)
 
+    # Steps 2-9: Exports only read the database and each write their own output
+    # subtree, so they run concurrently. Steps whose inputs and arguments are
+    # unchanged since the previous build are skipped.
+    output_dir_str = str(output_dir)
+    common = {"output_dir": output_dir_str, "version": version, "generated_at": generated_at}
+    steps = []
+
     # Step 2: Export JSON
     if not args.skip_json:
-        print("\n[2/9] Exporting JSON...")
-        export_json(db, str(output_dir), version, generated_at)
+        print("\n[2/10] Exporting JSON...")
+        if state.is_up_to_date("json", source_inputs, common):
+            print("  Up to date, skipping")
+        else:
+            steps.append(("JSON", export_json, common))
     else:
-        print("\n[2/9] Skipping JSON export")
+        print("\n[2/10] Skipping JSON export")
 
     # Step 3: Export SQLite (filaments)
     if not args.skip_sqlite:
-        print("\n[3/9] Exporting SQLite (filaments)...")
-        export_sqlite(db, str(output_dir), version, generated_at)
+        print("\n[3/10] Exporting SQLite (filaments)...")
+        if state.is_up_to_date("sqlite", source_inputs, common):
+            print("  Up to date, skipping")
+        else:
+            steps.append(("SQLite (filaments)", export_sqlite, common))
     else:
-        print("\n[3/9] Skipping SQLite export")
+        print("\n[3/10] Skipping SQLite export")
 
     # Step 4: Export SQLite (stores)
     if not args.skip_sqlite:
-        print("\n[4/9] Exporting SQLite (stores)...")
-        export_sqlite_stores(db, str(output_dir), version, generated_at)
+        print("\n[4/10] Exporting SQLite (stores)...")
+        if state.is_up_to_date("sqlite_stores", source_inputs, common):
+            print("  Up to date, skipping")
+        else:
+            steps.append(("SQLite (stores)", export_sqlite_stores, common))
     else:
-        print("\n[4/9] Skipping SQLite stores export")
+        print("\n[4/10] Skipping SQLite stores export")
 
     # Step 5: Export CSV
     if not args.skip_csv:
-        print("\n[5/9] Exporting CSV...")
-        export_csv(db, str(output_dir), version, generated_at)
+        print("\n[5/10] Exporting CSV...")
+        if state.is_up_to_date("csv", source_inputs, common):
+            print("  Up to date, skipping")
+        else:
+            steps.append(("CSV", export_csv, common))
     else:
-        print("\n[5/9] Skipping CSV export")
+        print("\n[5/10] Skipping CSV export")
 
     # Step 6: Export Static API
     if not args.skip_api:
-        print("\n[6/9] Exporting Static API...")
-        export_api(
-            db,
-            str(output_dir),
-            version,
-            generated_at,
-            schemas_dir=str(schemas_dir),
-            builder_schemas_dir=str(builder_schemas_dir),
-            data_dir=str(data_dir),
-            stores_dir=str(stores_dir),
-            commit=commit,
-        )
+        print("\n[6/10] Exporting Static API...")
+        api_kwargs = {
+            **common,
+            "schemas_dir": str(schemas_dir),
+            "builder_schemas_dir": str(builder_schemas_dir),
+            "data_dir": str(data_dir),
+            "stores_dir": str(stores_dir),
+            "commit": commit,
+        }
+        if state.is_up_to_date("api", [*source_inputs, schemas_dir], api_kwargs):
+            print("  Up to date, skipping")
+        else:
+            steps.append(("Static API", export_api, api_kwargs))
     else:
-        print("\n[6/9] Skipping Static API export")
+        print("\n[6/10] Skipping Static API export")
 
     # Step 7: Export HTML landing page
     if not args.skip_html:
-        print("\n[7/9] Exporting HTML landing page...")
-        templates_dir = Path(__file__).parent.parent / "builder" / "templates"
-        config_dir = project_root / "config"
-        export_html(db, str(output_dir), version, generated_at, str(templates_dir), str(config_dir))
+        print("\n[7/10] Exporting HTML landing page...")
+        html_kwargs = {**common, "templates_dir": str(templates_dir), "config_dir": str(config_dir)}
+        if state.is_up_to_date("html", [*source_inputs, config_dir], html_kwargs):
+            print("  Up to date, skipping")
+        else:
+            steps.append(("HTML landing page", export_html, html_kwargs))
     else:
-        print("\n[7/9] Skipping HTML export")
+        print("\n[7/10] Skipping HTML export")
 
     # Step 8: Export badges
-    print("\n[8/9] Exporting badges...")
-    export_badges(db, str(output_dir))
+    print("\n[8/10] Exporting badges...")
+    badges_kwargs = {"output_dir": output_dir_str}
+    if state.is_up_to_date("badges", source_inputs, badges_kwargs):
+        print("  Up to date, skipping")
+    else:
+        steps.append(("Badges", export_badges, badges_kwargs))
+
+    # Step 9: Export Parquet
+    if not args.skip_parquet:
+        print("\n[9/10] Exporting Parquet...")
+        if parquet_exporter.pa is None:
+            # Decided here so the database is not sent to a worker for nothing
+            print("  Skipping Parquet export: pyarrow is not installed (pip install pyarrow)")
+        elif state.is_up_to_date("parquet", source_inputs, common):
+            print("  Up to date, skipping")
+        else:
+            steps.append(("Parquet", export_parquet, common))
+    else:
+        print("\n[9/10] Skipping Parquet export")
+
+    sys.stdout.flush()
+    run_export_steps(db, steps)
+    state.save()
 
-    # Step 9: Generate directory listings (must run last so all dirs are covered)
+    # Step 10: Generate directory listings (must run last so all dirs are covered)
     if not args.skip_html:
-        print("\n[9/9] Generating directory listings...")
-        templates_dir = Path(__file__).parent.parent / "builder" / "templates"
+        print("\n[10/10] Generating directory listings...")
         export_directory_listings(str(output_dir), str(templates_dir))
     else:
-        print("\n[9/9] Skipping directory listings")
+        print("\n[10/10] Skipping directory listings")
 
     # Calculate checksums and write manifest
     print("\nGenerating checksums and manifest...")
-    checksums = calculate_checksums(str(output_dir))
-    write_manifest(str(output_dir), version, generated_at, checksums)
+    artifacts = calculate_checksums(str(output_dir), args.hash_algo)
+    write_manifest(str(output_dir), version, generated_at, artifacts, args.hash_algo)
 
     # Print any errors/warnings collected during build
     build_result.print_summary()
@@ -250,7 +618,7 @@ def run_build(args: argparse.Namespace) -> int:
     print("Build complete!")
     print("=" * 60)
     print(f"\nOutput files are in: {output_dir}")
-    print(f"Total artifacts: {len(checksums)}")
+    print(f"Total artifacts: {len(artifacts)}")
 
     if build_result.errors:
         print(
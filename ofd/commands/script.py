@@ -7,19 +7,16 @@ Scripts are auto-discovered from the ofd.scripts package.
 
 import argparse
 import sys
-from pathlib import Path
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-from ofd.base import get_script, list_scripts  # noqa: E402
+from ofd.base import get_script, list_scripts
 
 
 def _script_name_completer(prefix, parsed_args, **kwargs):
     """Provide tab completion for script names."""
     try:
-        import ofd.scripts  # noqa: F401
+        import ofd.scripts
+
+        ofd.scripts.ensure_loaded()
     except ImportError:
         return []
     from ofd.base import _script_registry
@@ -65,15 +62,20 @@ def run_script(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for errors)
     """
-    # Import scripts to register them
-    # This must happen after the base module is imported
+    # Scripts register themselves when their module is imported; discovery is
+    # lazy so only the modules that are needed get imported
     try:
-        import ofd.scripts  # noqa: F401
+        import ofd.scripts
     except ImportError as e:
         print(f"Warning: Could not import scripts module: {e}", file=sys.stderr)
+        ofd_scripts = None
+    else:
+        ofd_scripts = ofd.scripts
 
     # List available scripts
     if args.list or not args.script_name:
+        if ofd_scripts is not None:
+            ofd_scripts.ensure_loaded()
         scripts = list_scripts()
         if not scripts:
             print("No scripts available.")
@@ -96,8 +98,14 @@ def run_script(args: argparse.Namespace) -> int:
         print("Use 'ofd script <script_name> --help' for script-specific options.")
         return 0
 
-    # Get the script class
+    # Get the script class, importing just its module when possible
     script_class = get_script(args.script_name)
+    if script_class is None and ofd_scripts is not None:
+        ofd_scripts.load_script(args.script_name)
+        script_class = get_script(args.script_name)
+    if script_class is None and ofd_scripts is not None:
+        ofd_scripts.ensure_loaded()
+        script_class = get_script(args.script_name)
     if script_class is None:
         print(f"Error: Unknown script '{args.script_name}'", file=sys.stderr)
         print("\nUse 'ofd script --list' to see available scripts.", file=sys.stderr)
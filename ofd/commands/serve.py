@@ -6,27 +6,184 @@ with CORS headers enabled for local development.
 """
 
 import argparse
+import email.utils
+import gzip
 import http.server
-import socketserver
+import io
+import os
 import sys
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from http import HTTPStatus
 from pathlib import Path
 
+# Content types worth compressing; everything else (images, archives) is served as-is
+_COMPRESSIBLE_TYPES = ("application/json", "application/javascript", "image/svg+xml")
+# Below this size gzip framing outweighs the savings
+_MIN_COMPRESS_SIZE = 1024
+# Upper bound on the total size of cached compressed bodies
+_GZIP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows a gzip response."""
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                return float(params[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class _GzipCache:
+    """Thread-safe LRU of compressed file bodies, bounded by their total size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[int, int, bytes]] = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str, size: int, mtime_ns: int) -> bytes | None:
+        """Return the cached body if the file still has the given size and mtime."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != size or entry[1] != mtime_ns:
+                return None
+            self._entries.move_to_end(path)
+            return entry[2]
+
+    def put(self, path: str, size: int, mtime_ns: int, body: bytes) -> None:
+        """Cache a body, evicting the least recently used ones beyond max_bytes."""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._total -= len(old[2])
+            self._entries[path] = (size, mtime_ns, body)
+            self._total += len(body)
+            while self._total > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._total -= len(evicted)
+
+
+def _is_compressible(ctype: str) -> bool:
+    return ctype.startswith("text/") or ctype in _COMPRESSIBLE_TYPES
+
 
 class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
     """HTTP request handler with CORS headers enabled."""
 
+    # Keep connections alive so browsers can reuse them for the many small API files
+    protocol_version = "HTTP/1.1"
+
+    # Compressed bodies keyed by file path, shared by all handler threads
+    _gzip_cache = _GzipCache(_GZIP_CACHE_MAX_BYTES)
+
+    # Set by send_head when the response depends on Accept-Encoding
+    _vary_encoding = False
+
+    # CORS headers to allow requests from any origin, plus cache control for
+    # development, pre-encoded once rather than formatted per response
+    _CORS_HEADER_BLOB = (
+        b"Access-Control-Allow-Origin: *\r\n"
+        b"Access-Control-Allow-Methods: GET, OPTIONS\r\n"
+        b"Access-Control-Allow-Headers: Content-Type\r\n"
+        b"Cache-Control: no-store, no-cache, must-revalidate\r\n"
+    )
+
     def end_headers(self):
-        # Add CORS headers to allow requests from any origin
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
-        # Add cache control for development
-        self.send_header("Cache-Control", "no-store, no-cache, must-revalidate")
+        # send_response() has created the header buffer by now; HTTP/0.9
+        # responses carry no headers at all (mirrors send_header)
+        if self.request_version != "HTTP/0.9":
+            self._headers_buffer.append(self._CORS_HEADER_BLOB)
+            if self._vary_encoding:
+                # Compressible files are served gzip-encoded or not depending on
+                # the request, so caches must key on Accept-Encoding either way
+                self._headers_buffer.append(b"Vary: Accept-Encoding\r\n")
+        # The handler instance is reused for keep-alive requests
+        self._vary_encoding = False
         super().end_headers()
 
+    def send_head(self):
+        """Serve a gzip-encoded body when the client accepts it, else fall back."""
+        path = self.translate_path(self.path)
+        ctype = self.guess_type(path)
+        if _is_compressible(ctype):
+            self._vary_encoding = True
+            if _accepts_gzip(self.headers.get("Accept-Encoding", "")):
+                handled, body = self._send_head_gzip(path, ctype)
+                if handled:
+                    return body
+        return super().send_head()
+
+    def _not_modified(self, mtime: float) -> bool:
+        """Check If-Modified-Since against a file's mtime, like SimpleHTTPRequestHandler."""
+        if "If-Modified-Since" not in self.headers or "If-None-Match" in self.headers:
+            return False
+        try:
+            ims = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if ims.tzinfo is None:
+            # obsolete format with no timezone, cf. RFC 9110 section 5.6.7
+            ims = ims.replace(tzinfo=timezone.utc)
+        if ims.tzinfo is not timezone.utc:
+            return False
+        last_modified = datetime.fromtimestamp(mtime, timezone.utc).replace(microsecond=0)
+        return last_modified <= ims
+
+    def _send_head_gzip(self, path: str, ctype: str):
+        """
+        Send headers for a gzip response and return the body as a file object.
+
+        Each file is compressed once and cached until it changes. Returns
+        (handled, body): handled is False when the file should be served
+        uncompressed instead (directories, small files), and body is None
+        after a 304 Not Modified for a fresh If-Modified-Since.
+        """
+        try:
+            st = os.stat(path)
+            if not os.path.isfile(path) or st.st_size < _MIN_COMPRESS_SIZE:
+                return False, None
+        except OSError:
+            return False, None
+
+        if self._not_modified(st.st_mtime):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.end_headers()
+            return True, None
+
+        body = self._gzip_cache.get(path, st.st_size, st.st_mtime_ns)
+        if body is None:
+            try:
+                with open(path, "rb") as f:
+                    body = gzip.compress(f.read(), compresslevel=6)
+            except OSError:
+                return False, None
+            self._gzip_cache.put(path, st.st_size, st.st_mtime_ns, body)
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", ctype)
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+        self.end_headers()
+        return True, io.BytesIO(body)
+
     def do_OPTIONS(self):
         """Handle OPTIONS requests for CORS preflight."""
         self.send_response(200)
+        # Required with keep-alive so the client knows there is no body
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
     def log_message(self, format, *args):
@@ -35,6 +192,14 @@ class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
         print(f"[{self.log_date_time_string()}] {format % args}")
 
 
+class DevServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server so concurrent and keep-alive requests don't block each other."""
+
+    daemon_threads = True
+    # Fail on ports that are already bound so the port search below works
+    allow_reuse_address = False
+
+
 def register_subcommand(subparsers: argparse._SubParsersAction) -> None:
     """Register the serve subcommand."""
     parser = subparsers.add_parser(
@@ -97,7 +262,7 @@ def run_serve(args: argparse.Namespace) -> int:
 
     for _attempt in range(max_port_attempts):
         try:
-            with socketserver.TCPServer((args.host, port), handler) as httpd:
+            with DevServer((args.host, port), handler) as httpd:
                 host_display = args.host if args.host else "localhost"
                 print("=" * 60)
                 print("Open Filament Database - Development Server")
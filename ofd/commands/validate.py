@@ -9,6 +9,7 @@ import argparse
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ofd.validation import (
@@ -175,17 +176,27 @@ def run_validate(args: argparse.Namespace) -> int:
             print(_bold("Running all validations..."))
         result = orchestrator.validate_all(changes_json=changes_json)
     else:
-        # Run specific validations
-        if args.json_files:
-            result.merge(orchestrator.validate_json_files())
-        if args.logos:
-            result.merge(orchestrator.validate_logo_files())
-        if args.folder_names:
-            result.merge(orchestrator.validate_folder_names())
-        if args.store_ids:
-            result.merge(orchestrator.validate_store_ids())
-        if args.gtin:
-            result.merge(orchestrator.validate_gtin())
+        # Run specific validations. They check disjoint concerns, so run them
+        # concurrently and merge afterwards in a fixed order for stable output.
+        jobs = [
+            validator
+            for selected, validator in (
+                (args.json_files, orchestrator.validate_json_files),
+                (args.logos, orchestrator.validate_logo_files),
+                (args.folder_names, orchestrator.validate_folder_names),
+                (args.store_ids, orchestrator.validate_store_ids),
+                (args.gtin, orchestrator.validate_gtin),
+            )
+            if selected
+        ]
+        if len(jobs) == 1:
+            # Nothing to overlap with; skip the thread pool
+            result.merge(jobs[0]())
+        else:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [executor.submit(validator) for validator in jobs]
+                for future in futures:
+                    result.merge(future.result())
 
     # Output results
     if args.json:
@@ -6,6 +6,7 @@ the SvelteKit development server for editing the filament database.
 """
 
 import argparse
+import hashlib
 import shutil
 import subprocess
 import sys
@@ -13,6 +14,10 @@ from pathlib import Path
 
 project_root = Path(__file__).parent.parent.parent
 
+# Hash of the package-lock.json that node_modules was installed from, kept inside
+# node_modules so it disappears together with the install it describes
+LOCK_HASH_FILE = ".ofd_webui_lock_hash"
+
 
 def register_subcommand(subparsers: argparse._SubParsersAction) -> None:
     """Register the webui subcommand."""
@@ -28,6 +33,11 @@ Examples:
   ofd webui --host 0.0.0.0  Bind to all interfaces
   ofd webui --open          Open browser automatically
   ofd webui --install       Run npm ci before starting
+
+npm ci only runs when node_modules is missing, package-lock.json has changed
+since the last install, or --install is given. Skipping it keeps Vite's
+dependency cache (webui/node_modules/.vite) so restarts stay warm; deleting
+that directory forces a cold start.
         """,
     )
 
@@ -35,9 +45,16 @@ Examples:
         "-p", "--port", type=int, default=5173, help="Port to serve on (default: 5173)"
     )
     parser.add_argument("--host", default="localhost", help="Host to bind to (default: localhost)")
-    parser.add_argument("--open", action="store_true", help="Open browser automatically")
     parser.add_argument(
-        "--install", action="store_true", help="Run npm ci before starting the server"
+        "--open",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Open browser automatically (default: no)",
+    )
+    parser.add_argument(
+        "--install",
+        action="store_true",
+        help="Run npm ci before starting the server, even if dependencies are up to date",
     )
 
     parser.set_defaults(func=run_webui)
@@ -70,6 +87,32 @@ def check_node_modules() -> bool:
     return (webui_dir / "node_modules").exists()
 
 
+def get_lock_hash(webui_dir: Path) -> str | None:
+    """Return the SHA256 of webui/package-lock.json, or None if it is missing."""
+    try:
+        return hashlib.sha256((webui_dir / "package-lock.json").read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def read_installed_lock_hash(webui_dir: Path) -> str | None:
+    """Return the lock hash recorded by the last install, or None if none was recorded."""
+    try:
+        return (webui_dir / "node_modules" / LOCK_HASH_FILE).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def write_installed_lock_hash(webui_dir: Path, lock_hash: str | None) -> None:
+    """Record which package-lock.json the current node_modules was installed from."""
+    if lock_hash is None:
+        return
+    try:
+        (webui_dir / "node_modules" / LOCK_HASH_FILE).write_text(lock_hash, encoding="utf-8")
+    except OSError:
+        pass
+
+
 def run_npm_ci(webui_dir: Path) -> int:
     """Run npm ci in the webui directory."""
     print("Installing Node.js dependencies...")
@@ -104,15 +147,28 @@ def run_webui(args: argparse.Namespace) -> int:
         print("Or see: docs/installing-software.md", file=sys.stderr)
         return 1
 
-    # Install dependencies if requested or if node_modules doesn't exist
+    # Install dependencies if requested, if node_modules doesn't exist, or if
+    # package-lock.json changed since the last install. npm ci wipes
+    # node_modules (and Vite's cache in node_modules/.vite), so skip it otherwise.
     node_modules_exists = check_node_modules()
-    if args.install or not node_modules_exists:
+    lock_hash = get_lock_hash(webui_dir)
+    installed_hash = read_installed_lock_hash(webui_dir) if node_modules_exists else None
+    if node_modules_exists and installed_hash is None:
+        # Installed before lock hashes were recorded; trust it as before
+        write_installed_lock_hash(webui_dir, lock_hash)
+        installed_hash = lock_hash
+    lock_changed = lock_hash is not None and installed_hash != lock_hash
+
+    if args.install or not node_modules_exists or lock_changed:
         if not node_modules_exists:
             print("Node modules not found, running npm ci...")
+        elif lock_changed and not args.install:
+            print("package-lock.json changed since last install, running npm ci...")
         exit_code = run_npm_ci(webui_dir)
         if exit_code != 0:
             print("Error: npm ci failed", file=sys.stderr)
             return exit_code
+        write_installed_lock_hash(webui_dir, lock_hash)
 
     # Build the vite dev command
     # The '--' tells npm to pass subsequent arguments to the underlying script
@@ -22,21 +22,20 @@ import shutil
 from pathlib import Path
 from typing import Any
 
+from ofd.builder.utils import loads_json
+
 
 def load_json(path: Path) -> Any | None:
     """Load JSON with error handling."""
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        return loads_json(path.read_bytes())
     except (json.JSONDecodeError, OSError):
         return None
 
 
 def save_json(path: Path, data: Any) -> None:
-    """Save JSON with consistent 2-space formatting."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    """Save JSON with consistent 2-space formatting, written in a single call."""
+    path.write_bytes((json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8"))
 
 
 def merge_dicts(existing: dict, new: dict) -> dict:
@@ -26,15 +26,47 @@ import pkgutil
 
 logger = logging.getLogger(__name__)
 
-# Automatically import all modules in this package to register scripts.
-# Individual scripts that fail to import (e.g. missing optional deps)
-# are skipped so they don't break the rest of the package.
-__all__ = []
-for _importer, modname, ispkg in pkgutil.iter_modules(__path__):
-    if not ispkg:
-        try:
-            importlib.import_module(f".{modname}", __package__)
-        except ImportError as exc:
-            logger.debug("Skipping script %s: %s", modname, exc)
-            continue
-        __all__.append(modname)
+__all__ = ["ensure_loaded", "load_script"]
+
+_all_loaded = False
+
+
+def _import_script_module(modname: str) -> bool:
+    """Import a script module so its @register_script decorators run."""
+    try:
+        importlib.import_module(f".{modname}", __package__)
+    except ImportError as exc:
+        # Scripts that fail to import (e.g. missing optional deps) are skipped
+        # so they don't break the rest of the package.
+        logger.debug("Skipping script %s: %s", modname, exc)
+        return False
+    return True
+
+
+def ensure_loaded() -> None:
+    """
+    Import all modules in this package to register every script.
+
+    Discovery is deferred until a caller needs the full registry (listing or
+    completion), so importing the package stays cheap. Safe to call repeatedly.
+    """
+    global _all_loaded
+    if _all_loaded:
+        return
+    for _importer, modname, ispkg in pkgutil.iter_modules(__path__):
+        if not ispkg:
+            _import_script_module(modname)
+    _all_loaded = True
+
+
+def load_script(name: str) -> None:
+    """
+    Import only the module for a single script.
+
+    Script modules are named after the script they register, so running one
+    script does not pay for importing all the others.
+    """
+    if _all_loaded or not name.isidentifier():
+        return
+    if any(modname == name for _, modname, _ in pkgutil.iter_modules(__path__)):
+        _import_script_module(name)
@@ -10,15 +10,25 @@ import argparse
 import json
 import os
 import re
+import shutil
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from jsonschema.exceptions import ValidationError as JsonSchemaValidationError
+from jsonschema.exceptions import SchemaError
 from jsonschema.validators import Draft7Validator
 from referencing import Registry, Resource
 
 from ofd.base import BaseScript, ScriptResult, register_script
+from ofd.builder.utils import loads_json
+
+try:
+    import orjson
+except ImportError:  # optional speedup, the stdlib json module is used otherwise
+    orjson = None
 
 PathLike = str | os.PathLike[str]
 COLOR_HEX_PATTERN = re.compile(r"#?([a-fA-F0-9]{6})")
@@ -31,18 +41,19 @@ COLOR_HEX_PATTERN = re.compile(r"#?([a-fA-F0-9]{6})")
 
 def shallow_remove_empty(input_dict: dict) -> dict:
     """Remove elements that are 'None' or have an empty list/dict."""
-    cpy = input_dict.copy()
-    for k, v in input_dict.items():
-        if v is None or (isinstance(v, (list, dict)) and len(v) == 0):
-            del cpy[k]
-    return cpy
+    return {
+        k: v
+        for k, v in input_dict.items()
+        if v is not None and not (isinstance(v, (list, dict)) and not v)
+    }
 
 
 def normalize_color_hex(input_data: list[str]) -> list[str]:
     """Takes a list of color hex values and normalizes them."""
     res: list[str] = []
+    fullmatch = COLOR_HEX_PATTERN.fullmatch
     for item in input_data:
-        match = re.fullmatch(COLOR_HEX_PATTERN, item.strip())
+        match = fullmatch(item.strip())
         if match:
             res.append(match.group(1).upper())
         else:
@@ -50,28 +61,80 @@ def normalize_color_hex(input_data: list[str]) -> list[str]:
     return res
 
 
+LOGO_NAMES = ("logo.png", "logo.jpg", "logo.svg")
+
+
+def scan_dir(path: Path) -> tuple[list[Path], set[str]]:
+    """
+    List a directory once: its subdirectories sorted by name, and its file names.
+
+    Uses directory entry types instead of stat calls, so callers can test for
+    files like brand.json by name without probing each path. The subdirectory
+    order is kept at every level: distinct source names can map to the same
+    output folder after cleansing, and the last one written must not depend
+    on filesystem listing order.
+    """
+    subdirs = []
+    files = set()
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir():
+                subdirs.append(entry)
+            elif entry.is_file():
+                files.add(entry.name)
+    subdirs.sort(key=lambda e: e.name)
+    return [Path(entry.path) for entry in subdirs], files
+
+
+def sorted_subdirs(path: Path) -> list[Path]:
+    """List subdirectories sorted by name."""
+    return scan_dir(path)[0]
+
+
+def copy_logo(src: Path, dst: Path, link: bool = False) -> None:
+    """
+    Copy a logo file, optionally as a hardlink.
+
+    With link=True the destination shares the source's inode when both are on
+    the same filesystem; otherwise (or if linking fails) the file is copied.
+    """
+    if link:
+        try:
+            dst.unlink(missing_ok=True)
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # cross-device or unsupported filesystem, fall back to copying
+    shutil.copy2(src, dst)
+
+
 def cleanse_folder_name(name: str) -> str:
     """Clean folder name by replacing slashes."""
     return name.replace("/", " ").strip()
 
 
-def load_json(json_path: PathLike) -> dict[str, Any] | None:
-    """Load JSON from file with error handling."""
+def load_json(json_path: PathLike, report: Callable[[str], None] = print) -> dict[str, Any] | None:
+    """Load JSON from file with error handling; errors are passed to report."""
     try:
-        with open(json_path, encoding="utf8") as file:
-            return json.load(file)
+        return loads_json(Path(json_path).read_bytes())
     except json.JSONDecodeError:
-        print(f"Failed to parse JSON from file: {json_path}")
+        report(f"Failed to parse JSON from file: {json_path}")
     except OSError:
-        print(f"Failed to open JSON file: {json_path}")
+        report(f"Failed to open JSON file: {json_path}")
     return None
 
 
-def save_json(path: Path, data: Any) -> None:
-    """Save JSON to file with consistent formatting."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
-        f.write("\n")
+def save_json(path: Path, data: Any, fast: bool = False) -> None:
+    """
+    Save JSON to file with consistent formatting, encoded up front and written at once.
+
+    With fast=True and orjson installed, writes 2-space indented JSON via orjson
+    (orjson cannot produce the default 4-space indent).
+    """
+    if fast and orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
+    path.write_bytes((json.dumps(data, indent=4, ensure_ascii=False) + "\n").encode("utf-8"))
 
 
 # ---------------------------------
@@ -86,13 +149,19 @@ class SchemaLoader:
         self.schemas_dir = schemas_dir
         self._schemas: dict[str, dict] = {}
         self._registry: Registry | None = None
+        self._validators: dict[str, Draft7Validator | None] = {}
+        self._validators_lock = threading.Lock()
+
+        # Schemas are preloaded in one directory scan, so lookups from the
+        # brand worker threads only ever read the cache
+        if schemas_dir.is_dir():
+            with os.scandir(schemas_dir) as it:
+                for entry in it:
+                    if entry.name.endswith("_schema.json") and entry.is_file():
+                        self._schemas[entry.name[: -len("_schema.json")]] = load_json(entry.path)
 
     def get(self, name: str) -> dict | None:
         """Get schema by name."""
-        if name not in self._schemas:
-            path = self.schemas_dir / f"{name}_schema.json"
-            if path.exists():
-                self._schemas[name] = load_json(path)
         return self._schemas.get(name)
 
     @property
@@ -108,19 +177,45 @@ class SchemaLoader:
             self._registry = Registry().with_resources(resources)
         return self._registry
 
-    def validate(self, data: Any, schema_name: str) -> bool:
-        """Validate data against a schema."""
-        schema = self.get(schema_name)
+    def get_validator(self, name: str) -> Draft7Validator | None:
+        """
+        Get a validator for a schema, building it once per schema name.
+
+        Returns None if the schema is missing or is not a valid Draft 7 schema.
+        An invalid schema is reported once, the first time it is requested.
+        """
+        if name in self._validators:
+            return self._validators[name]
+        # Brand worker threads ask for the same validators concurrently
+        with self._validators_lock:
+            if name not in self._validators:
+                self._validators[name] = self._build_validator(name)
+            return self._validators[name]
+
+    def _build_validator(self, name: str) -> Draft7Validator | None:
+        """Check a schema and build its validator."""
+        schema = self.get(name)
         if schema is None:
-            return True  # No schema, assume valid
-
+            return None
         try:
-            validator = Draft7Validator(schema, registry=self.registry)
-            validator.validate(data)
+            Draft7Validator.check_schema(schema)
+        except SchemaError as error:
+            print(f"Invalid schema {name}_schema.json: {error.message}")
+            return None
+        return Draft7Validator(schema, registry=self.registry)
+
+    def validate(self, data: Any, schema_name: str, report: Callable[[str], None] = print) -> bool:
+        """Validate data against a schema; the first error is passed to report."""
+        validator = self.get_validator(schema_name)
+        if validator is None:
+            return True  # No usable schema, assume valid
+
+        # Stop at the first error instead of collecting every error to rank them
+        error = next(validator.iter_errors(data), None)
+        if error is None:
             return True
-        except JsonSchemaValidationError as error:
-            print(f"Validation failed: {error.message} at {error.json_path}")
-            return False
+        report(f"Validation failed: {error.message} at {error.json_path}")
+        return False
 
 
 # ---------------------------------
@@ -141,6 +236,17 @@ class ExportStats:
     purchase_links: int = 0
     errors: int = 0
 
+    def merge(self, other: "ExportStats") -> None:
+        """Add another set of statistics to this one."""
+        self.brands += other.brands
+        self.materials += other.materials
+        self.filaments += other.filaments
+        self.variants += other.variants
+        self.sizes += other.sizes
+        self.stores += other.stores
+        self.purchase_links += other.purchase_links
+        self.errors += other.errors
+
     def to_dict(self) -> dict[str, int]:
         return {
             "brands": self.brands,
@@ -161,6 +267,10 @@ class ExportDataScript(BaseScript):
     name = "export_data"
     description = "Export database to a folder structure"
 
+    # Set from --fast-json / --link-logos in run()
+    fast_json = False
+    link_logos = False
+
     def configure_parser(self, parser: argparse.ArgumentParser) -> None:
         """Add script-specific arguments."""
         parser.add_argument(
@@ -176,11 +286,23 @@ class ExportDataScript(BaseScript):
             help="Include stores in export (default: true)",
         )
         parser.add_argument("--validate", action="store_true", help="Validate data before export")
+        parser.add_argument(
+            "--fast-json",
+            action="store_true",
+            help="Write 2-space indented JSON using orjson when installed (default: 4-space)",
+        )
+        parser.add_argument(
+            "--link-logos",
+            action="store_true",
+            help="Hardlink logo files instead of copying them when on the same filesystem",
+        )
 
     def run(self, args: argparse.Namespace) -> ScriptResult:
         """Execute the export_data script."""
         dry_run = getattr(args, "dry_run", False)
         do_validate = getattr(args, "validate", False)
+        self.fast_json = getattr(args, "fast_json", False)
+        self.link_logos = getattr(args, "link_logos", False)
         output_dir = Path(args.output)
 
         if dry_run:
@@ -247,13 +369,11 @@ class ExportDataScript(BaseScript):
         """Export stores and return a mapping of store_id -> store_data."""
         stores = {}
 
-        for store_dir in sorted(self.stores_dir.iterdir()):
-            if not store_dir.is_dir():
+        for store_dir in sorted_subdirs(self.stores_dir):
+            _, store_files = scan_dir(store_dir)
+            if "store.json" not in store_files:
                 continue
-
             store_file = store_dir / "store.json"
-            if not store_file.exists():
-                continue
 
             data = load_json(store_file)
             if data is None:
@@ -273,16 +393,12 @@ class ExportDataScript(BaseScript):
             else:
                 store_output = output_dir / store_id
                 store_output.mkdir(exist_ok=True)
-                save_json(store_output / "store.json", data)
+                save_json(store_output / "store.json", data, fast=self.fast_json)
 
                 # Copy logo if exists
-                for logo_name in ["logo.png", "logo.jpg", "logo.svg"]:
-                    logo_src = store_dir / logo_name
-                    if logo_src.exists():
-                        import shutil
-
-                        shutil.copy2(logo_src, store_output / logo_name)
-                        break
+                logo_name = next((name for name in LOGO_NAMES if name in store_files), None)
+                if logo_name:
+                    copy_logo(store_dir / logo_name, store_output / logo_name, link=self.link_logos)
 
         return stores
 
@@ -295,116 +411,197 @@ class ExportDataScript(BaseScript):
         dry_run: bool,
         do_validate: bool,
     ) -> None:
-        """Export data directory structure."""
-        import shutil
-
-        for brand_dir in sorted(self.data_dir.iterdir()):
-            if not brand_dir.is_dir():
-                continue
-
-            brand_file = brand_dir / "brand.json"
-            if not brand_file.exists():
-                continue
+        """Export data directory structure, brands spread over worker threads."""
+        brand_dirs = sorted_subdirs(self.data_dir)
+
+        # Brands that map to the same output folder (also when the names only
+        # differ by case) share one worker and are exported in sorted order, so
+        # the files that end up in the shared folder never depend on timing
+        groups: dict[str, list[Path]] = {}
+        for brand_dir in brand_dirs:
+            groups.setdefault(self._brand_output_key(brand_dir), []).append(brand_dir)
+
+        # Exporting is dominated by file I/O, which releases the GIL. Each group
+        # writes its own subtree and returns per-brand stats and messages.
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        results: dict[Path, tuple[ExportStats, list[str]]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._export_brand_group,
+                    members,
+                    output_dir,
+                    schema_loader,
+                    dry_run,
+                    do_validate,
+                )
+                for members in groups.values()
+            ]
+            for members, future in zip(groups.values(), futures, strict=True):
+                results.update(zip(members, future.result(), strict=True))
+
+        # Merged and reported in sorted brand order, as a sequential export would
+        for brand_dir in brand_dirs:
+            brand_stats, messages = results[brand_dir]
+            stats.merge(brand_stats)
+            for message in messages:
+                print(message)
+
+    def _brand_output_key(self, brand_dir: Path) -> str:
+        """Return the case-folded output folder name a brand directory exports to."""
+        brand_data = load_json(brand_dir / "brand.json", report=lambda _message: None)
+        name = brand_data.get("name", brand_dir.name) if isinstance(brand_data, dict) else None
+        return cleanse_folder_name(name or brand_dir.name).casefold()
+
+    def _export_brand_group(
+        self,
+        brand_dirs: list[Path],
+        output_dir: Path,
+        schema_loader: SchemaLoader,
+        dry_run: bool,
+        do_validate: bool,
+    ) -> list[tuple[ExportStats, list[str]]]:
+        """Export brands sharing an output folder one after another, in the given order."""
+        return [
+            self._export_brand(brand_dir, output_dir, schema_loader, dry_run, do_validate)
+            for brand_dir in brand_dirs
+        ]
+
+    def _export_brand(
+        self,
+        brand_dir: Path,
+        output_dir: Path,
+        schema_loader: SchemaLoader,
+        dry_run: bool,
+        do_validate: bool,
+    ) -> tuple[ExportStats, list[str]]:
+        """Export one brand directory; returns its stats and the messages to print."""
+        stats = ExportStats()
+        # Printed by the caller in brand order instead of from the worker thread
+        messages: list[str] = []
+        report = messages.append
+        # Output is collected during traversal and written at the end: every
+        # directory is created once, then files are written in a tight loop
+        dirs: set[Path] = set()
+        writes: list[tuple[Path, Any]] = []
+        copies: list[tuple[Path, Path]] = []
+
+        material_dirs, brand_files = scan_dir(brand_dir)
+        if "brand.json" not in brand_files:
+            return stats, messages
+        brand_file = brand_dir / "brand.json"
+
+        brand_data = load_json(brand_file, report)
+        if brand_data is None:
+            stats.errors += 1
+            return stats, messages
+
+        if do_validate and not schema_loader.validate(brand_data, "brand", report):
+            stats.errors += 1
+            return stats, messages
+
+        brand_name = brand_data.get("name", brand_dir.name)
+        stats.brands += 1
+        if dry_run and not self.json_mode:
+            report(f"  Brand: {brand_name}")
 
-            brand_data = load_json(brand_file)
-            if brand_data is None:
-                stats.errors += 1
+        if not dry_run:
+            brand_output = output_dir / cleanse_folder_name(brand_name)
+            dirs.add(brand_output)
+            writes.append((brand_output / "brand.json", brand_data))
+
+            # Copy logo
+            logo_name = next((name for name in LOGO_NAMES if name in brand_files), None)
+            if logo_name:
+                copies.append((brand_dir / logo_name, brand_output / logo_name))
+
+        # Counted in locals during traversal and stored on stats once at the end
+        materials = filaments = variants = sizes = purchase_links = errors = 0
+
+        # Process materials
+        for material_dir in material_dirs:
+            filament_dirs, material_files = scan_dir(material_dir)
+            if "material.json" not in material_files:
                 continue
+            material_file = material_dir / "material.json"
 
-            if do_validate and not schema_loader.validate(brand_data, "brand"):
-                stats.errors += 1
+            material_data = load_json(material_file, report)
+            if material_data is None:
+                errors += 1
                 continue
 
-            brand_name = brand_data.get("name", brand_dir.name)
-            stats.brands += 1
+            material_name = material_data.get("material", material_dir.name)
+            materials += 1
 
-            if dry_run:
-                self.log(f"  Brand: {brand_name}")
-            else:
-                brand_output = output_dir / cleanse_folder_name(brand_name)
-                brand_output.mkdir(exist_ok=True)
-                save_json(brand_output / "brand.json", brand_data)
-
-                # Copy logo
-                for logo_name in ["logo.png", "logo.jpg", "logo.svg"]:
-                    logo_src = brand_dir / logo_name
-                    if logo_src.exists():
-                        shutil.copy2(logo_src, brand_output / logo_name)
-                        break
-
-            # Process materials
-            for material_dir in sorted(brand_dir.iterdir()):
-                if not material_dir.is_dir():
-                    continue
+            if not dry_run:
+                material_output = brand_output / cleanse_folder_name(material_name)
+                dirs.add(material_output)
+                writes.append((material_output / "material.json", material_data))
 
-                material_file = material_dir / "material.json"
-                if not material_file.exists():
+            # Process filaments
+            for filament_dir in filament_dirs:
+                variant_dirs, filament_files = scan_dir(filament_dir)
+                if "filament.json" not in filament_files:
                     continue
+                filament_file = filament_dir / "filament.json"
 
-                material_data = load_json(material_file)
-                if material_data is None:
-                    stats.errors += 1
+                filament_data = load_json(filament_file, report)
+                if filament_data is None:
+                    errors += 1
                     continue
 
-                material_name = material_data.get("material", material_dir.name)
-                stats.materials += 1
+                filament_name = filament_data.get("name", filament_dir.name)
+                filaments += 1
 
                 if not dry_run:
-                    material_output = brand_output / cleanse_folder_name(material_name)
-                    material_output.mkdir(exist_ok=True)
-                    save_json(material_output / "material.json", material_data)
+                    filament_output = material_output / cleanse_folder_name(filament_name)
+                    dirs.add(filament_output)
+                    writes.append((filament_output / "filament.json", filament_data))
 
-                # Process filaments
-                for filament_dir in sorted(material_dir.iterdir()):
-                    if not filament_dir.is_dir():
-                        continue
+                # Process variants
+                for variant_dir in variant_dirs:
+                    variant_file = variant_dir / "variant.json"
+                    sizes_file = variant_dir / "sizes.json"
 
-                    filament_file = filament_dir / "filament.json"
-                    if not filament_file.exists():
+                    if not variant_file.exists():
                         continue
 
-                    filament_data = load_json(filament_file)
-                    if filament_data is None:
-                        stats.errors += 1
+                    variant_data = load_json(variant_file, report)
+                    if variant_data is None:
+                        errors += 1
                         continue
 
-                    filament_name = filament_data.get("name", filament_dir.name)
-                    stats.filaments += 1
+                    variant_name = variant_data.get("name", variant_dir.name)
+                    variants += 1
 
-                    if not dry_run:
-                        filament_output = material_output / cleanse_folder_name(filament_name)
-                        filament_output.mkdir(exist_ok=True)
-                        save_json(filament_output / "filament.json", filament_data)
-
-                    # Process variants
-                    for variant_dir in sorted(filament_dir.iterdir()):
-                        if not variant_dir.is_dir():
-                            continue
-
-                        variant_file = variant_dir / "variant.json"
-                        sizes_file = variant_dir / "sizes.json"
-
-                        if not variant_file.exists():
-                            continue
+                    # Count sizes and purchase links
+                    sizes_data = load_json(sizes_file, report) if sizes_file.exists() else []
+                    if sizes_data:
+                        sizes += len(sizes_data)
+                        purchase_links += sum(
+                            len(size.get("purchase_links", ())) for size in sizes_data
+                        )
 
-                        variant_data = load_json(variant_file)
-                        if variant_data is None:
-                            stats.errors += 1
-                            continue
-
-                        variant_name = variant_data.get("name", variant_dir.name)
-                        stats.variants += 1
-
-                        # Count sizes and purchase links
-                        sizes_data = load_json(sizes_file) if sizes_file.exists() else []
+                    if not dry_run:
+                        variant_output = filament_output / cleanse_folder_name(variant_name)
+                        dirs.add(variant_output)
+                        writes.append((variant_output / "variant.json", variant_data))
                         if sizes_data:
-                            stats.sizes += len(sizes_data)
-                            for size in sizes_data:
-                                stats.purchase_links += len(size.get("purchase_links", []))
-
-                        if not dry_run:
-                            variant_output = filament_output / cleanse_folder_name(variant_name)
-                            variant_output.mkdir(exist_ok=True)
-                            save_json(variant_output / "variant.json", variant_data)
-                            if sizes_data:
-                                save_json(variant_output / "sizes.json", sizes_data)
+                            writes.append((variant_output / "sizes.json", sizes_data))
+
+        stats.materials = materials
+        stats.filaments = filaments
+        stats.variants = variants
+        stats.sizes = sizes
+        stats.purchase_links = purchase_links
+        stats.errors += errors
+
+        # Parents sort before their children, so each mkdir finds its parent present
+        for directory in sorted(dirs, key=lambda d: len(d.parts)):
+            directory.mkdir(parents=True, exist_ok=True)
+        for src, dst in copies:
+            copy_logo(src, dst, link=self.link_logos)
+        for path, data in writes:
+            save_json(path, data, fast=self.fast_json)
+
+        return stats, messages
@@ -13,6 +13,7 @@ import re
 import subprocess
 import urllib.parse
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -47,6 +48,10 @@ from ofd.scripts.opt_naming_rules import (
 # OpenPrintTag repository URL
 OPENPRINTTAG_REPO = "https://github.com/OpenPrintTag/openprinttag-database.git"
 
+# Brandfetch domain candidates probed at once; later batches only run if
+# no candidate in the earlier ones matched
+_DOMAIN_PROBE_WORKERS = 3
+
 # Default material densities (g/cm³)
 DENSITY_DEFAULTS: dict[str, float] = {
     "PLA": 1.24,
@@ -454,6 +459,14 @@ class ImportOpenPrintTagScript(BaseScript):
         self.brandfetch_client_id: str | None = None
         self.output_dir: Path = self.data_dir
         self.merge_mode: bool = True
+        self._session: requests.Session | None = None
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session shared by all Brandfetch requests, so connections are reused."""
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
 
     def configure_parser(self, parser: argparse.ArgumentParser) -> None:
         """Add script-specific arguments."""
@@ -912,14 +925,22 @@ class ImportOpenPrintTagScript(BaseScript):
             f"{normalized}-filament.com",
         ]
 
-        for domain in patterns:
+        def probe(domain: str) -> bool:
+            # requests.Session is not thread-safe, so each probe makes its own request
             url = f"https://cdn.brandfetch.io/{domain}?c={self.brandfetch_client_id}"
             try:
-                response = requests.head(url, timeout=5)
-                if response.ok:
-                    return f"https://{domain}"
+                return requests.head(url, timeout=5).ok
             except Exception:
-                continue
+                return False
+
+        # Probe a small batch of candidates at a time and stop after the first
+        # batch with a match, taking the earliest matching pattern in that batch
+        with ThreadPoolExecutor(max_workers=_DOMAIN_PROBE_WORKERS) as executor:
+            for start in range(0, len(patterns), _DOMAIN_PROBE_WORKERS):
+                batch = patterns[start : start + _DOMAIN_PROBE_WORKERS]
+                for domain, found in zip(batch, executor.map(probe, batch), strict=True):
+                    if found:
+                        return f"https://{domain}"
 
         # Fallback: try Brandfetch Search API
         return self._search_brandfetch(brand_name)
@@ -940,7 +961,7 @@ class ImportOpenPrintTagScript(BaseScript):
         headers = {"Authorization": f"Bearer {self.brandfetch_client_id}"}
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             if response.ok:
                 results = response.json()
                 # Take the first/best match if available
@@ -964,8 +985,10 @@ class ImportOpenPrintTagScript(BaseScript):
 
         url = f"https://cdn.brandfetch.io/{domain_only}?c={self.brandfetch_client_id}"
         try:
-            response = requests.get(url, timeout=10)
-            if response.ok:
+            with self.session.get(url, timeout=10, stream=True) as response:
+                if not response.ok:
+                    return None
+
                 content_type = response.headers.get("content-type", "").lower()
 
                 # Validate content-type is actually an image
@@ -981,8 +1004,11 @@ class ImportOpenPrintTagScript(BaseScript):
                     # Not an image (likely HTML error page)
                     return None
 
+                chunks = response.iter_content(chunk_size=64 * 1024)
+                first_chunk = next(chunks, b"")
+
                 # Extra safety: check content doesn't start with HTML
-                content_start = response.content[:100].lower()
+                content_start = first_chunk[:100].lower()
                 if b"<!doctype" in content_start or b"<html" in content_start:
                     return None
 
@@ -994,9 +1020,18 @@ class ImportOpenPrintTagScript(BaseScript):
                 else:
                     ext = "png"
 
+                # Stream to a temporary file so a failed download leaves no partial logo
                 brand_dir.mkdir(parents=True, exist_ok=True)
                 logo_path = brand_dir / f"logo.{ext}"
-                logo_path.write_bytes(response.content)
+                tmp_path = logo_path.with_name(logo_path.name + ".part")
+                try:
+                    with open(tmp_path, "wb") as f:
+                        f.write(first_chunk)
+                        for chunk in chunks:
+                            f.write(chunk)
+                    tmp_path.replace(logo_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
                 return ext
         except Exception:
             pass
@@ -2173,6 +2208,4 @@ class ImportOpenPrintTagScript(BaseScript):
 
     def _save_json(self, path: Path, data: Any) -> None:
         """Save data to JSON file with consistent formatting."""
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        path.write_bytes((json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8"))
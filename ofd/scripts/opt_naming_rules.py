@@ -1570,13 +1570,18 @@ GENERIC_RENAME_RULES = [
 # ---------------------------------------------------------------------------
 
 
+_SLUG_SEPARATORS_RE = re.compile(r"[-\s]+")
+_SLUG_INVALID_RE = re.compile(r"[^a-z0-9_]")
+_SLUG_UNDERSCORES_RE = re.compile(r"_+")
+
+
 def slugify(text: str) -> str:
     """Convert text to a valid ID (lowercase, underscores)."""
     text = text.lower()
-    text = re.sub(r"[-\s]+", "_", text)
-    text = re.sub(r"[^a-z0-9_]", "", text)
+    text = _SLUG_SEPARATORS_RE.sub("_", text)
+    text = _SLUG_INVALID_RE.sub("", text)
     text = text.strip("_")
-    text = re.sub(r"_+", "_", text)
+    text = _SLUG_UNDERSCORES_RE.sub("_", text)
     return text or "default"
 
 
@@ -21,13 +21,23 @@ Pipeline (runs in order):
 """
 
 import argparse
+import hashlib
 import json
+import os
+import pickle
 import re
+import stat
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from ofd.base import BaseScript, ScriptResult, register_script
+from ofd.builder.utils import loads_json
 from ofd.merge import merge_has_errors, merge_trees
 from ofd.validation import ValidationOrchestrator
 
@@ -49,13 +59,45 @@ OPTIONAL_STRING_FIELDS = {
     "ean",
 }
 
+# Directories never descended into when fixing indentation repo-wide
+INDENT_EXCLUDED_DIRS = frozenset(
+    {"node_modules", ".git", "dist", "build", ".venv", "venv", ".ofd_cache"}
+)
 
-@dataclass
-class SchemaInfo:
-    """Holds key ordering information for a schema."""
+# Files already found styled, relative to the project root (see StyleCache)
+STYLE_CACHE_FILE = Path(".ofd_cache") / "style_manifest.json"
+
+# Bump when sanitizing, sorting or formatting rules change to drop cached results
+STYLE_CACHE_VERSION = 1
+
+# Coarsest mtime resolution StyleCache allows for (FAT stores mtimes in 2 s steps)
+STYLE_CACHE_MTIME_TICK_NS = 2_000_000_000
+
+
+@dataclass(eq=False)
+class ReorderPlan:
+    """
+    Key ordering for one kind of object, compiled from a schema.
+
+    entries pairs each key (in schema order) with the plan for its nested
+    object or array items, or None. Plans of nested objects may refer to each
+    other (and to themselves), so they are built in two passes.
+    """
+
+    entries: tuple[tuple[str, "ReorderPlan | None"], ...] = ()
+    key_set: frozenset[str] = frozenset()
+
+
+# Plan for objects without a schema: every key is extra and sorted alphabetically
+EMPTY_PLAN = ReorderPlan()
 
-    keys: list[str] = field(default_factory=list)
-    nested: dict[str, list[str]] = field(default_factory=dict)
+
+class SchemaInfo(NamedTuple):
+    """Holds key ordering information for a schema, precomputed into immutable tuples."""
+
+    keys: tuple[str, ...]
+    nested: dict[str, tuple[str, ...]]
+    plan: ReorderPlan
 
 
 @dataclass
@@ -67,6 +109,13 @@ class ProcessingStats:
     files_skipped: int = 0
     extra_keys_found: int = 0
 
+    def record(self, result: "FileResult") -> None:
+        """Add the outcome of one file to the statistics."""
+        self.files_processed += result.processed
+        self.files_modified += result.modified
+        self.files_skipped += result.skipped
+        self.extra_keys_found += result.extra_keys
+
     def to_dict(self) -> dict[str, int]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -77,23 +126,91 @@ class ProcessingStats:
         }
 
 
+@dataclass
+class FileResult:
+    """Outcome of styling one JSON file, returned from the worker processes."""
+
+    messages: list[str] = field(default_factory=list)
+    processed: bool = False
+    modified: bool = False
+    skipped: bool = False
+    extra_keys: int = 0
+    # Set when the file on disk is fully styled afterwards (see StyleCache)
+    clean: bool = False
+    extra_key_names: list[str] = field(default_factory=list)
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Encode JSON with the repo formatting (2-space indent, raw UTF-8, trailing newline).
+
+    Always uses the stdlib encoder: the faster libraries format some floats
+    and NaN differently or reject very large integers, and the files written
+    must not depend on which optional library is installed.
+    """
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
 def load_json(path: Path) -> dict[str, Any] | None:
     """Load JSON from file with error handling."""
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        return loads_json(path.read_bytes())
     except (json.JSONDecodeError, OSError) as e:
         print(f"Error loading {path}: {e}")
         return None
 
 
+def write_atomic(path: Path, content: bytes) -> None:
+    """Write a file via a temporary sibling and a rename, so it is never left half-written."""
+    tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    try:
+        tmp_path.write_bytes(content)
+        # The rename replaces the file, so carry its permission bits over
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
 def save_json(path: Path, data: Any, dry_run: bool) -> None:
     """Save JSON to file with consistent formatting."""
     if dry_run:
         return
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    write_atomic(path, dumps_json(data))
+
+
+def iter_json_files(root: Path, excluded_dirs: frozenset[str]) -> Iterator[Path]:
+    """
+    Yield all *.json files below root in sorted path order, skipping excluded directory names.
+
+    Walks depth-first with an explicit os.scandir stack, sorting each
+    directory's entries by name, so paths come out in the same order as
+    sorted() would give without collecting them first. Excluded trees
+    (node_modules, .git, ...) are pruned without being listed. Symlinked
+    directories are not followed, matching Path.rglob.
+    """
+
+    def sorted_entries(directory: str) -> Iterator[os.DirEntry]:
+        try:
+            with os.scandir(directory) as it:
+                return iter(sorted(it, key=lambda entry: entry.name))
+        except OSError:
+            return iter(())
+
+    stack = [sorted_entries(str(root))]
+    while stack:
+        for entry in stack[-1]:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in excluded_dirs:
+                    stack.append(sorted_entries(entry.path))
+                    break
+            elif entry.name.endswith(".json") and entry.is_file():
+                yield Path(entry.path)
+        else:
+            stack.pop()
 
 
 def fix_slug(name: str) -> str:
@@ -230,8 +347,7 @@ def load_schemas(schemas_dir: Path) -> dict[str, dict[str, Any]]:
 
     for schema_file in schemas_dir.glob("*.json"):
         try:
-            with open(schema_file, encoding="utf-8") as f:
-                schemas[schema_file.stem] = json.load(f)
+            schemas[schema_file.stem] = loads_json(schema_file.read_bytes())
         except json.JSONDecodeError as e:
             print(f"Error parsing {schema_file.name}: {e}")
 
@@ -269,8 +385,53 @@ def extract_nested_schemas(schema: dict[str, Any]) -> dict[str, list[str]]:
     return nested
 
 
+def compile_reorder_plan(keys: list[str], nested: dict[str, list[str]]) -> ReorderPlan:
+    """
+    Compile a schema's key orderings into a ReorderPlan.
+
+    A key listed in nested (at any depth) gets the plan for that nested key
+    order, mirroring how the nested map applies to every level of a document.
+    """
+    nested_plans = {name: ReorderPlan() for name in nested}
+    for name, order in nested.items():
+        nested_plans[name].entries = tuple((key, nested_plans.get(key)) for key in order)
+        nested_plans[name].key_set = frozenset(order)
+    return ReorderPlan(
+        entries=tuple((key, nested_plans.get(key)) for key in keys), key_set=frozenset(keys)
+    )
+
+
+def _schemas_fingerprint(schemas_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """Name, mtime and size of every schema file; changes whenever a schema does."""
+    try:
+        with os.scandir(schemas_dir) as it:
+            return tuple(
+                sorted(
+                    (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                    for entry in it
+                    if entry.name.endswith(".json")
+                )
+            )
+    except OSError:
+        return ()
+
+
 def build_key_order_map(schemas_dir: Path) -> dict[str, SchemaInfo]:
-    """Build a mapping of schema names to their key orderings."""
+    """
+    Build a mapping of schema names to their key orderings.
+
+    Memoized per process for as long as the schema files are unchanged, so
+    repeated in-process runs skip loading and compiling the schemas.
+    The returned mapping is shared and must not be modified.
+    """
+    return _build_key_order_map(schemas_dir, _schemas_fingerprint(schemas_dir))
+
+
+@lru_cache(maxsize=4)
+def _build_key_order_map(
+    schemas_dir: Path, fingerprint: tuple[tuple[str, int, int], ...]
+) -> dict[str, SchemaInfo]:
+    """Uncached build_key_order_map; fingerprint is only part of the cache key."""
     schemas = load_schemas(schemas_dir)
     key_order_map = {}
 
@@ -285,78 +446,319 @@ def build_key_order_map(schemas_dir: Path) -> dict[str, SchemaInfo]:
             keys = get_property_order(schema_content)
             nested = extract_nested_schemas(schema_content)
 
-        key_order_map[clean_name] = SchemaInfo(keys=keys, nested=nested)
+        key_order_map[clean_name] = SchemaInfo(
+            keys=tuple(keys),
+            nested={name: tuple(order) for name, order in nested.items()},
+            plan=compile_reorder_plan(keys, nested),
+        )
 
     return key_order_map
 
 
+def reorder_json_keys(data: Any, schema_info: SchemaInfo, extra_keys: set[str]) -> bool:
+    """
+    Sort JSON keys according to schema ordering, reordering dicts in place.
+
+    Schema keys come first in schema order, followed by any other keys in
+    alphabetical order (those are added to extra_keys). Nested values are
+    walked with an explicit work stack instead of recursion. Containers are
+    matched with exact type checks, as parsed JSON only holds plain dicts and
+    lists.
+
+    Returns True if any key changed position, so callers can tell whether the
+    document changed without serializing it before and after.
+    """
+    moved = False
+    stack: list[tuple[Any, ReorderPlan]] = [(data, schema_info.plan)]
+
+    while stack:
+        value, plan = stack.pop()
+
+        if type(value) is list:
+            stack.extend((item, plan) for item in value if type(item) in (dict, list))
+            continue
+        if type(value) is not dict:
+            continue
+
+        original_order = None if moved else list(value)
+        extra = value.keys() - plan.key_set
+
+        # Popping and reinserting moves each key to the end, in schema order
+        for key, child_plan in plan.entries:
+            if key not in value:
+                continue
+            child = value[key] = value.pop(key)
+
+            if child_plan is not None:
+                if type(child) is list:
+                    stack.extend((item, child_plan) for item in child if type(item) is dict)
+                else:
+                    stack.append((child, child_plan))
+            elif type(child) is dict:
+                stack.append((child, EMPTY_PLAN))
+            elif type(child) is list:
+                stack.extend((item, plan) for item in child if type(item) is dict)
+
+        if extra:
+            extra_keys.update(extra)
+            for key in sorted(extra):
+                child = value[key] = value.pop(key)
+                if type(child) is dict:
+                    stack.append((child, EMPTY_PLAN))
+                elif type(child) is list:
+                    stack.extend((item, EMPTY_PLAN) for item in child if type(item) is dict)
+
+        if original_order is not None and list(value) != original_order:
+            moved = True
+
+    return moved
+
+
 def sort_json_keys(data: Any, schema_info: SchemaInfo, extra_keys: set[str]) -> Any:
-    """Recursively sort JSON keys according to schema ordering."""
-    if isinstance(data, dict):
-        ordered = {}
-        remaining_keys = set(data.keys())
-
-        for key in schema_info.keys:
-            if key in data:
-                value = data[key]
-
-                if key in schema_info.nested:
-                    nested_info = SchemaInfo(
-                        keys=schema_info.nested[key], nested=schema_info.nested
-                    )
-
-                    if isinstance(value, list):
-                        value = [
-                            sort_json_keys(item, nested_info, extra_keys)
-                            if isinstance(item, dict)
-                            else item
-                            for item in value
-                        ]
-                    else:
-                        value = sort_json_keys(value, nested_info, extra_keys)
-                elif isinstance(value, dict):
-                    value = sort_json_keys(value, SchemaInfo(), extra_keys)
-                elif isinstance(value, list):
-                    value = [
-                        sort_json_keys(item, schema_info, extra_keys)
-                        if isinstance(item, dict)
-                        else item
-                        for item in value
-                    ]
-
-                ordered[key] = value
-                remaining_keys.remove(key)
-
-        if remaining_keys:
-            extra_keys.update(remaining_keys)
-            for key in sorted(remaining_keys):
-                value = data[key]
-                if isinstance(value, dict):
-                    value = sort_json_keys(value, SchemaInfo(), extra_keys)
-                elif isinstance(value, list):
-                    value = [
-                        sort_json_keys(item, SchemaInfo(), extra_keys)
-                        if isinstance(item, dict)
-                        else item
-                        for item in value
-                    ]
-                ordered[key] = value
-
-        return ordered
-
-    elif isinstance(data, list):
-        result = []
-        for item in data:
-            if isinstance(item, dict):
-                result.append(sort_json_keys(item, schema_info, extra_keys))
-            elif isinstance(item, list):
-                result.append(sort_json_keys(item, schema_info, extra_keys))
-            else:
-                result.append(item)
+    """Sort JSON keys according to schema ordering (in place); returns data."""
+    reorder_json_keys(data, schema_info, extra_keys)
+    return data
+
+
+# ---------------------------------
+# Per-file processing (runs in worker processes)
+# ---------------------------------
+
+# Loaded once per worker process by _init_worker, so the map is not pickled per file
+_worker_key_order_map: dict[str, SchemaInfo] = {}
+
+
+def _init_worker(shm_name: str, size: int) -> None:
+    """Process pool initializer: unpickle the schema key orderings from shared memory."""
+    global _worker_key_order_map
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        with shm.buf[:size] as view:
+            _worker_key_order_map = pickle.loads(view)
+    finally:
+        shm.close()
+
+
+def _relative_path(file_path: Path, project_root: Path) -> Path:
+    """Path relative to the project root for log messages, if possible."""
+    try:
+        return file_path.relative_to(project_root)
+    except ValueError:
+        return file_path
+
+
+def style_json_file(
+    file_path: Path, schema_name: str, *, dry_run: bool, project_root: Path
+) -> FileResult:
+    """Process a single JSON file: sanitize data, then sort keys."""
+    result = FileResult()
+    data = load_json(file_path)
+    if data is None:
+        result.skipped = True
+        return result
+
+    if schema_name not in _worker_key_order_map:
+        result.messages.append(f"  Warning: No schema found for {schema_name}")
+        result.skipped = True
+        return result
+
+    # Sanitize data (fix IDs, empty strings, defaults)
+    data, sanitize_changes = sanitize_data(data, schema_name)
+    for change in sanitize_changes:
+        rel_path = _relative_path(file_path, project_root)
+        if dry_run:
+            result.messages.append(f"  Would fix {rel_path}: {change}")
+        else:
+            result.messages.append(f"  Fixed {rel_path}: {change}")
+
+    # Sort keys according to schema (in place)
+    schema_info = _worker_key_order_map[schema_name]
+    extra_keys: set[str] = set()
+
+    keys_moved = reorder_json_keys(data, schema_info, extra_keys)
+
+    if extra_keys:
+        result.extra_key_names = sorted(extra_keys)
+        result.messages.append(
+            f"  Warning: Extra keys in {file_path.name}: {result.extra_key_names}"
+        )
+        result.extra_keys = len(extra_keys)
+
+    result.processed = True
+    result.clean = True
+
+    if sanitize_changes or keys_moved:
+        if dry_run:
+            result.messages.append(f"  Would sort: {file_path.name}")
+        else:
+            result.messages.append(f"  Sorted: {file_path.name}")
+        save_json(file_path, data, dry_run)
+        result.modified = True
+        result.clean = not dry_run
+
+    return result
+
+
+def fix_json_indentation(file_path: Path, *, dry_run: bool, project_root: Path) -> FileResult:
+    """
+    Fix indentation of a JSON file to use 2 spaces.
+
+    The file is read once; the re-encoded bytes are compared against the raw
+    contents and written back only if they differ.
+    """
+    result = FileResult()
+    try:
+        original_content = file_path.read_bytes()
+    except OSError as e:
+        result.messages.append(f"Error reading {file_path}: {e}")
+        result.skipped = True
+        return result
+
+    try:
+        data = loads_json(original_content)
+    except json.JSONDecodeError as e:
+        print(f"Error loading {file_path}: {e}")
+        result.skipped = True
+        return result
+
+    new_content = dumps_json(data)
+
+    result.processed = True
+
+    if original_content != new_content:
+        rel_path = _relative_path(file_path, project_root)
+        if dry_run:
+            result.messages.append(f"  Would fix indentation: {rel_path}")
+        else:
+            result.messages.append(f"  Fixed indentation: {rel_path}")
+
+        if not dry_run:
+            try:
+                write_atomic(file_path, new_content)
+            except OSError as e:
+                result.messages.append(f"Error writing {file_path}: {e}")
+                result.skipped = True
+                return result
+
+        result.modified = True
+
+    result.clean = not (dry_run and result.modified)
+    return result
+
+
+def map_files(
+    func: Callable[..., FileResult],
+    *iterables: Iterable,
+    key_order_map: dict[str, SchemaInfo] | None = None,
+) -> Iterator[FileResult]:
+    """
+    Run a per-file function over all files on a process pool, yielding results in input order.
+
+    Files are independent (load, fix, write), so they are spread across one
+    worker per CPU. The key order map is pickled once into a shared memory
+    block that every worker unpickles when it starts. With a single CPU the
+    work runs in-process instead.
+    """
+    global _worker_key_order_map
+    workers = os.cpu_count() or 1
+    if workers == 1:
+        _worker_key_order_map = key_order_map or {}
+        yield from map(func, *iterables)
+        return
+
+    blob = pickle.dumps(key_order_map or {}, protocol=pickle.HIGHEST_PROTOCOL)
+    size = len(blob)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        shm.buf[:size] = blob
+        del blob
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(shm.name, size)
+        ) as executor:
+            yield from executor.map(func, *iterables, chunksize=16)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+class StyleCache:
+    """
+    Remembers which files were already fully styled, to skip them next run.
+
+    Entries are keyed by path relative to the project root and validated by
+    mtime and size, so a file is only skipped if it has not changed since it
+    was last found clean. Extra keys are stored so their warnings are still
+    reported. The cache is dropped whenever the schemas or STYLE_CACHE_VERSION
+    change. Sections: "style" (sanitize + sort) and "indent".
+
+    A file edited again within the same mtime tick keeps its recorded mtime,
+    so entries whose mtime is within one tick of the save are not kept; those
+    files are processed again on the next run.
+    """
+
+    def __init__(self, project_root: Path, schemas_dir: Path):
+        self.project_root = project_root
+        self.path = project_root / STYLE_CACHE_FILE
+        self.fingerprint = hashlib.sha256(
+            repr((STYLE_CACHE_VERSION, _schemas_fingerprint(schemas_dir))).encode()
+        ).hexdigest()
+        self.sections: dict[str, dict[str, list]] = {"style": {}, "indent": {}}
+        try:
+            cached = json.loads(self.path.read_bytes())
+            if cached.get("fingerprint") == self.fingerprint:
+                for name in self.sections:
+                    self.sections[name] = cached.get(name, {})
+        except (OSError, ValueError, AttributeError):
+            pass  # no usable cache, every file is processed
+
+    def _key(self, file_path: Path) -> str:
+        return _relative_path(file_path, self.project_root).as_posix()
+
+    def lookup(self, section: str, file_path: Path) -> FileResult | None:
+        """Result to report for an unchanged clean file, or None to process it."""
+        entry = self.sections[section].get(self._key(file_path))
+        if entry is None:
+            return None
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None
+        mtime_ns, size, extra_key_names = entry
+        if (st.st_mtime_ns, st.st_size) != (mtime_ns, size):
+            return None
+
+        result = FileResult(processed=True, clean=True, extra_key_names=extra_key_names)
+        if extra_key_names:
+            result.messages.append(f"  Warning: Extra keys in {file_path.name}: {extra_key_names}")
+            result.extra_keys = len(extra_key_names)
         return result
 
-    else:
-        return data
+    def record(self, section: str, file_path: Path, result: FileResult) -> None:
+        """Store or drop a file's entry after it was processed."""
+        key = self._key(file_path)
+        entries = self.sections[section]
+        try:
+            st = file_path.stat() if result.clean else None
+        except OSError:
+            st = None
+        if st is None:
+            entries.pop(key, None)
+        else:
+            entries[key] = [st.st_mtime_ns, st.st_size, result.extra_key_names]
+
+    def save(self) -> None:
+        """Write the cache file, leaving out entries too recent to trust."""
+        racy_since_ns = time.time_ns() - STYLE_CACHE_MTIME_TICK_NS
+        for entries in self.sections.values():
+            racy = [key for key, (mtime_ns, _, _) in entries.items() if mtime_ns >= racy_since_ns]
+            for key in racy:
+                del entries[key]
+        self.path.parent.mkdir(exist_ok=True)
+        write_atomic(
+            self.path,
+            json.dumps({"fingerprint": self.fingerprint, **self.sections}).encode("utf-8"),
+        )
 
 
 @register_script
@@ -391,72 +793,66 @@ class StyleDataScript(BaseScript):
             choices=["brand", "material", "filament", "variant", "store", "sizes"],
             help="Schema type to use when formatting stdin (required with --format-stdin)",
         )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help=f"Process every file, ignoring files recorded as styled in {STYLE_CACHE_FILE}",
+        )
 
-    def _fix_json_indentation(self, file_path: Path, dry_run: bool, stats: ProcessingStats) -> bool:
-        """Fix indentation of a JSON file to use 2 spaces."""
-        data = load_json(file_path)
-        if data is None:
-            stats.files_skipped += 1
-            return False
-
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                original_content = f.read()
-        except OSError as e:
-            self.log(f"Error reading {file_path}: {e}")
-            stats.files_skipped += 1
-            return False
-
-        new_content = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
-
-        stats.files_processed += 1
-
-        if original_content != new_content:
-            try:
-                rel_path = file_path.relative_to(self.project_root)
-            except ValueError:
-                rel_path = file_path
-            if dry_run:
-                self.log(f"  Would fix indentation: {rel_path}")
-            else:
-                self.log(f"  Fixed indentation: {rel_path}")
-
-            if not dry_run:
-                try:
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(new_content)
-                except OSError as e:
-                    self.log(f"Error writing {file_path}: {e}")
-                    stats.files_skipped += 1
-                    return False
-
-            stats.files_modified += 1
-            return True
-
-        return False
-
-    def _fix_all_json_indentation(self, dry_run: bool) -> ProcessingStats:
+    def _fix_all_json_indentation(self, dry_run: bool, cache: StyleCache | None) -> ProcessingStats:
         """Fix indentation for all JSON files in the repository."""
         stats = ProcessingStats()
 
         self.log("Fixing indentation for all JSON files...")
 
-        json_files = list(self.project_root.rglob("*.json"))
-
-        excluded_dirs = {"node_modules", ".git", "dist", "build", ".venv", "venv"}
-        json_files = [f for f in json_files if not any(part in excluded_dirs for part in f.parts)]
+        json_files = iter_json_files(self.project_root, INDENT_EXCLUDED_DIRS)
 
-        for json_file in sorted(json_files):
-            self._fix_json_indentation(json_file, dry_run, stats)
+        fix = partial(fix_json_indentation, dry_run=dry_run, project_root=self.project_root)
+        # Per-file messages are discarded in JSON mode, so skip the calls altogether
+        log = None if self.json_mode else self.log
+        record = stats.record
+        for result in self._map_with_cache(cache, "indent", fix, json_files):
+            if log:
+                for message in result.messages:
+                    log(message)
+            record(result)
 
         return stats
 
+    def _map_with_cache(
+        self,
+        cache: StyleCache | None,
+        section: str,
+        func: Callable[..., FileResult],
+        paths: Iterable[Path],
+        *iterables: list,
+        key_order_map: dict[str, SchemaInfo] | None = None,
+    ) -> Iterable[FileResult]:
+        """map_files over paths (plus parallel iterables), reusing cached results for unchanged files."""
+        if cache is None:
+            return map_files(func, paths, *iterables, key_order_map=key_order_map)
+
+        paths = list(paths)
+        results: list[FileResult | None] = [cache.lookup(section, path) for path in paths]
+        pending = [i for i, result in enumerate(results) if result is None]
+        computed = map_files(
+            func,
+            [paths[i] for i in pending],
+            *([values[i] for i in pending] for values in iterables),
+            key_order_map=key_order_map,
+        )
+        for i, result in zip(pending, computed, strict=True):
+            results[i] = result
+            cache.record(section, paths[i], result)
+        return results
+
     def run(self, args: argparse.Namespace) -> ScriptResult:
         """Execute the style_data script."""
         dry_run = getattr(args, "dry_run", False)
         fix_indent_only = getattr(args, "fix_indent_only", False)
         format_stdin = getattr(args, "format_stdin", False)
         schema_type = getattr(args, "schema_type", None)
+        use_cache = not getattr(args, "no_cache", False)
 
         # Handle --format-stdin mode: read JSON from stdin, sort keys, output to stdout
         if format_stdin:
@@ -471,7 +867,7 @@ class StyleDataScript(BaseScript):
             import sys
 
             try:
-                input_data = json.loads(sys.stdin.read())
+                input_data = loads_json(sys.stdin.read().encode("utf-8"))
             except json.JSONDecodeError as e:
                 return ScriptResult(success=False, message=f"Invalid JSON input: {e}")
 
@@ -482,7 +878,7 @@ class StyleDataScript(BaseScript):
             extra_keys: set[str] = set()
             styled = sort_json_keys(input_data, key_order_map[schema_type], extra_keys)
             # Output styled JSON with 2-space indent (matching repo convention) + trailing newline
-            print(json.dumps(styled, indent=2, ensure_ascii=False))
+            sys.stdout.write(dumps_json(styled).decode("utf-8"))
 
             return ScriptResult(
                 success=True,
@@ -493,10 +889,14 @@ class StyleDataScript(BaseScript):
         if dry_run:
             self.log("=== DRY RUN MODE - No files will be modified ===\n")
 
+        cache = StyleCache(self.project_root, self.schemas_dir) if use_cache else None
+
         # Handle --fix-indent-only mode
         if fix_indent_only:
             self.emit_progress("fixing_indentation", 0, "Fixing indentation for all JSON files...")
-            total_stats = self._fix_all_json_indentation(dry_run)
+            total_stats = self._fix_all_json_indentation(dry_run, cache)
+            if cache and not dry_run:
+                cache.save()
             self.emit_progress("fixing_indentation", 100, "Indentation fixes complete")
 
             self.log(f"\n{'=' * 60}")
@@ -540,7 +940,7 @@ class StyleDataScript(BaseScript):
         data_stats = ProcessingStats()
         if self.data_dir.exists():
             self.emit_progress("sorting_data", 0, "Processing data directory...")
-            data_stats = self._process_data_directory(key_order_map, dry_run)
+            data_stats = self._process_data_directory(key_order_map, dry_run, cache)
             self.emit_progress("sorting_data", 100, "Data directory processing complete")
         else:
             self.log(f"Data directory not found: {self.data_dir}")
@@ -549,11 +949,14 @@ class StyleDataScript(BaseScript):
         stores_stats = ProcessingStats()
         if self.stores_dir.exists():
             self.emit_progress("sorting_stores", 0, "Processing stores directory...")
-            stores_stats = self._process_stores_directory(key_order_map, dry_run)
+            stores_stats = self._process_stores_directory(key_order_map, dry_run, cache)
             self.emit_progress("sorting_stores", 100, "Stores directory processing complete")
         else:
             self.log(f"Stores directory not found: {self.stores_dir}")
 
+        if cache and not dry_run:
+            cache.save()
+
         # Merge statistics
         total_stats = ProcessingStats(
             files_processed=data_stats.files_processed + stores_stats.files_processed,
@@ -618,80 +1021,67 @@ class StyleDataScript(BaseScript):
 
         return ScriptResult(success=True, message="Styling complete", data=result_data)
 
-    def _process_json_file(
+    def _style_files(
         self,
-        file_path: Path,
-        schema_name: str,
+        plan: list[str | tuple[Path, str]],
         key_order_map: dict[str, SchemaInfo],
         dry_run: bool,
-        stats: ProcessingStats,
-    ) -> bool:
-        """Process a single JSON file: sanitize data, then sort keys."""
-        data = load_json(file_path)
-        if data is None:
-            stats.files_skipped += 1
-            return False
-
-        if schema_name not in key_order_map:
-            self.log(f"  Warning: No schema found for {schema_name}")
-            stats.files_skipped += 1
-            return False
-
-        # Sanitize data (fix IDs, empty strings, defaults)
-        data, sanitize_changes = sanitize_data(data, schema_name)
-        for change in sanitize_changes:
-            try:
-                rel_path = file_path.relative_to(self.project_root)
-            except ValueError:
-                rel_path = file_path
-            if dry_run:
-                self.log(f"  Would fix {rel_path}: {change}")
-            else:
-                self.log(f"  Fixed {rel_path}: {change}")
-
-        # Sort keys according to schema
-        schema_info = key_order_map[schema_name]
-        extra_keys: set[str] = set()
-
-        sorted_data = sort_json_keys(data, schema_info, extra_keys)
-
-        if extra_keys:
-            self.log(f"  Warning: Extra keys in {file_path.name}: {sorted(extra_keys)}")
-            stats.extra_keys_found += len(extra_keys)
-
-        original_json = json.dumps(data, ensure_ascii=False, sort_keys=False)
-        sorted_json = json.dumps(sorted_data, ensure_ascii=False, sort_keys=False)
+        cache: StyleCache | None,
+    ) -> ProcessingStats:
+        """
+        Style the files in a walk plan and log the results in plan order.
 
-        stats.files_processed += 1
+        A plan mixes log lines (str) with (file_path, schema_name) entries.
+        """
+        stats = ProcessingStats()
+        files = [entry for entry in plan if not isinstance(entry, str)]
+        style = partial(style_json_file, dry_run=dry_run, project_root=self.project_root)
+        # Collected up front so the worker pool is shut down before logging
+        results = iter(
+            list(
+                self._map_with_cache(
+                    cache,
+                    "style",
+                    style,
+                    [path for path, _ in files],
+                    [schema_name for _, schema_name in files],
+                    key_order_map=key_order_map,
+                )
+            )
+        )
 
-        modified = bool(sanitize_changes) or (original_json != sorted_json)
-        if modified:
-            if dry_run:
-                self.log(f"  Would sort: {file_path.name}")
-            else:
-                self.log(f"  Sorted: {file_path.name}")
-            save_json(file_path, sorted_data, dry_run)
-            stats.files_modified += 1
-            return True
+        # Per-file messages are discarded in JSON mode, so skip the calls altogether
+        log = None if self.json_mode else self.log
+        record = stats.record
+        for entry in plan:
+            if isinstance(entry, str):
+                if log:
+                    log(entry)
+                continue
+            result = next(results)
+            if log:
+                for message in result.messages:
+                    log(message)
+            record(result)
 
-        return False
+        return stats
 
     def _process_data_directory(
-        self, key_order_map: dict[str, SchemaInfo], dry_run: bool
+        self, key_order_map: dict[str, SchemaInfo], dry_run: bool, cache: StyleCache | None
     ) -> ProcessingStats:
         """Process all JSON files in the data directory hierarchy."""
-        stats = ProcessingStats()
         self.log("Processing data directory...")
+        plan: list[str | tuple[Path, str]] = []
 
         for brand_dir in sorted(self.data_dir.iterdir()):
             if not brand_dir.is_dir():
                 continue
 
-            self.log(f"  Brand: {brand_dir.name}")
+            plan.append(f"  Brand: {brand_dir.name}")
 
             brand_file = brand_dir / "brand.json"
             if brand_file.exists():
-                self._process_json_file(brand_file, "brand", key_order_map, dry_run, stats)
+                plan.append((brand_file, "brand"))
 
             for material_dir in sorted(brand_dir.iterdir()):
                 if not material_dir.is_dir():
@@ -699,9 +1089,7 @@ class StyleDataScript(BaseScript):
 
                 material_file = material_dir / "material.json"
                 if material_file.exists():
-                    self._process_json_file(
-                        material_file, "material", key_order_map, dry_run, stats
-                    )
+                    plan.append((material_file, "material"))
 
                 for filament_dir in sorted(material_dir.iterdir()):
                     if not filament_dir.is_dir():
@@ -709,9 +1097,7 @@ class StyleDataScript(BaseScript):
 
                     filament_file = filament_dir / "filament.json"
                     if filament_file.exists():
-                        self._process_json_file(
-                            filament_file, "filament", key_order_map, dry_run, stats
-                        )
+                        plan.append((filament_file, "filament"))
 
                     for variant_dir in sorted(filament_dir.iterdir()):
                         if not variant_dir.is_dir():
@@ -719,33 +1105,29 @@ class StyleDataScript(BaseScript):
 
                         variant_file = variant_dir / "variant.json"
                         if variant_file.exists():
-                            self._process_json_file(
-                                variant_file, "variant", key_order_map, dry_run, stats
-                            )
+                            plan.append((variant_file, "variant"))
 
                         sizes_file = variant_dir / "sizes.json"
                         if sizes_file.exists():
-                            self._process_json_file(
-                                sizes_file, "sizes", key_order_map, dry_run, stats
-                            )
+                            plan.append((sizes_file, "sizes"))
 
-        return stats
+        return self._style_files(plan, key_order_map, dry_run, cache)
 
     def _process_stores_directory(
-        self, key_order_map: dict[str, SchemaInfo], dry_run: bool
+        self, key_order_map: dict[str, SchemaInfo], dry_run: bool, cache: StyleCache | None
     ) -> ProcessingStats:
         """Process all JSON files in the stores directory."""
-        stats = ProcessingStats()
         self.log("\nProcessing stores directory...")
+        plan: list[str | tuple[Path, str]] = []
 
         for store_dir in sorted(self.stores_dir.iterdir()):
             if not store_dir.is_dir():
                 continue
 
-            self.log(f"  Store: {store_dir.name}")
+            plan.append(f"  Store: {store_dir.name}")
 
             store_file = store_dir / "store.json"
             if store_file.exists():
-                self._process_json_file(store_file, "store", key_order_map, dry_run, stats)
+                plan.append((store_file, "store"))
 
-        return stats
+        return self._style_files(plan, key_order_map, dry_run, cache)
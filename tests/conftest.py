@@ -0,0 +1,21 @@
+"""Shared fixtures for the test suite."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# A few real brands (with every entity level) keep the fixtures realistic
+SAMPLE_BRANDS = ("22_network", "3d_fuel", "3d_prima_basic")
+
+
+@pytest.fixture
+def sample_tree(tmp_path) -> Path:
+    """Copy a handful of brands and all stores into a temporary project tree."""
+    root = tmp_path / "sample"
+    for brand in SAMPLE_BRANDS:
+        shutil.copytree(PROJECT_ROOT / "data" / brand, root / "data" / brand)
+    shutil.copytree(PROJECT_ROOT / "stores", root / "stores")
+    return root
@@ -0,0 +1,256 @@
+"""Tests for the incremental build bookkeeping in ofd.commands.build."""
+
+import gzip
+import hashlib
+import json
+import os
+
+import pytest
+
+from ofd.builder.crawler import crawl_data
+from ofd.builder.exporters import export_csv, export_json
+from ofd.builder.models import Database
+from ofd.commands import build
+from ofd.commands.build import BuildState, calculate_checksums, run_export_steps
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    source = tmp_path / "data"
+    (source / "acme").mkdir(parents=True)
+    (source / "acme" / "brand.json").write_text('{"name": "Acme"}\n')
+    return source
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    output = tmp_path / "dist"
+    output.mkdir()
+    (output / "index.html").write_text("<html></html>\n")
+    return output
+
+
+def _build(state_path, output_dir, source_dir, now, **kwargs):
+    """Mimic run_build: resolve the timestamp, check one step, save the state."""
+    state = BuildState(state_path, output_dir, force=kwargs.pop("force", False))
+    generated_at = state.resolve_generated_at([source_dir], ("1.0.0", None), now)
+    skipped = state.is_up_to_date("html", [source_dir], {"generated_at": generated_at, **kwargs})
+    state.save()
+    return state, skipped
+
+
+def test_build_state_skips_unchanged_inputs(tmp_path, source_dir, output_dir):
+    state_path = tmp_path / "cache" / "build_state.json"
+
+    state, skipped = _build(state_path, output_dir, source_dir, "T1")
+    assert not skipped
+    assert not state.reused_generated_at
+
+    state, skipped = _build(state_path, output_dir, source_dir, "T2")
+    assert skipped
+    assert state.reused_generated_at
+    assert state.generated_at == "T1"
+
+
+def test_build_state_ignores_mtime_only_changes(tmp_path, source_dir, output_dir):
+    state_path = tmp_path / "build_state.json"
+    _build(state_path, output_dir, source_dir, "T1")
+
+    brand_file = source_dir / "acme" / "brand.json"
+    os.utime(brand_file, ns=(0, 0))
+
+    state, skipped = _build(state_path, output_dir, source_dir, "T2")
+    assert skipped
+    assert state.generated_at == "T1"
+
+
+def test_build_state_invalidates_on_content_change(tmp_path, source_dir, output_dir):
+    state_path = tmp_path / "build_state.json"
+    _build(state_path, output_dir, source_dir, "T1")
+
+    (source_dir / "acme" / "brand.json").write_text('{"name": "Acme Inc"}\n')
+
+    state, skipped = _build(state_path, output_dir, source_dir, "T2")
+    assert not skipped
+    assert state.generated_at == "T2"
+
+
+def test_build_state_invalidates_on_new_file(tmp_path, source_dir, output_dir):
+    state_path = tmp_path / "build_state.json"
+    _build(state_path, output_dir, source_dir, "T1")
+
+    (source_dir / "acme" / "logo.png").write_bytes(b"\x89PNG")
+
+    _, skipped = _build(state_path, output_dir, source_dir, "T2")
+    assert not skipped
+
+
+def test_build_state_invalidates_on_argument_change(tmp_path, source_dir, output_dir):
+    state_path = tmp_path / "build_state.json"
+    _build(state_path, output_dir, source_dir, "T1", base_url="")
+
+    _, skipped = _build(state_path, output_dir, source_dir, "T2", base_url="/ofd")
+    assert not skipped
+
+
+def test_build_state_requires_step_outputs(tmp_path, source_dir, output_dir):
+    state_path = tmp_path / "build_state.json"
+    _build(state_path, output_dir, source_dir, "T1")
+
+    (output_dir / "index.html").unlink()
+
+    _, skipped = _build(state_path, output_dir, source_dir, "T2")
+    assert not skipped
+
+
+def test_build_state_force(tmp_path, source_dir, output_dir):
+    state_path = tmp_path / "build_state.json"
+    _build(state_path, output_dir, source_dir, "T1")
+
+    state, skipped = _build(state_path, output_dir, source_dir, "T2", force=True)
+    assert not skipped
+    assert state.generated_at == "T2"
+
+
+def test_build_state_is_not_written_to_output(tmp_path, source_dir, output_dir):
+    state_path = tmp_path / "cache" / "build_state.json"
+    _build(state_path, output_dir, source_dir, "T1")
+
+    assert state_path.exists()
+    assert sorted(p.name for p in output_dir.iterdir()) == ["index.html"]
+
+
+@pytest.fixture
+def count_digests(monkeypatch):
+    """Count the files calculate_checksums actually hashes."""
+    hashed = []
+    digest = build.calculate_file_digest
+
+    def counting_digest(path, algo="sha256"):
+        hashed.append(os.path.basename(path))
+        return digest(path, algo)
+
+    monkeypatch.setattr(build, "calculate_file_digest", counting_digest)
+    return hashed
+
+
+def test_checksums_match_sha256(tmp_path, output_dir):
+    (output_dir / "json").mkdir()
+    (output_dir / "json" / "all.json").write_bytes(b"[]\n")
+
+    checksums = calculate_checksums(str(output_dir), cache_path=tmp_path / "cache.json")
+
+    assert checksums == [
+        (
+            "index.html",
+            hashlib.sha256(b"<html></html>\n").hexdigest(),
+            len(b"<html></html>\n"),
+        ),
+        (os.path.join("json", "all.json"), hashlib.sha256(b"[]\n").hexdigest(), 3),
+    ]
+
+
+def test_checksums_reuse_cached_digests(tmp_path, output_dir, count_digests):
+    cache_path = tmp_path / "cache" / "manifest_cache.json"
+    (output_dir / "all.json").write_bytes(b"[]\n")
+
+    first = calculate_checksums(str(output_dir), cache_path=cache_path)
+    assert sorted(count_digests) == ["all.json", "index.html"]
+
+    count_digests.clear()
+    assert calculate_checksums(str(output_dir), cache_path=cache_path) == first
+    assert count_digests == []
+
+    (output_dir / "all.json").write_bytes(b'[{"name": "Acme"}]\n')
+    count_digests.clear()
+    checksums = {
+        path: digest
+        for path, digest, _ in calculate_checksums(str(output_dir), cache_path=cache_path)
+    }
+    assert count_digests == ["all.json"]
+    assert checksums["all.json"] == hashlib.sha256(b'[{"name": "Acme"}]\n').hexdigest()
+
+
+def test_checksums_cache_is_per_algorithm(tmp_path, output_dir, count_digests):
+    cache_path = tmp_path / "manifest_cache.json"
+    calculate_checksums(str(output_dir), cache_path=cache_path)
+    assert json.loads(cache_path.read_text())["algo"] == "sha256"
+
+    # A cache left by another algorithm is discarded, not trusted
+    cache = json.loads(cache_path.read_text())
+    cache["algo"] = "blake3"
+    cache_path.write_text(json.dumps(cache))
+    count_digests.clear()
+    calculate_checksums(str(output_dir), cache_path=cache_path)
+    assert count_digests == ["index.html"]
+
+
+def test_checksums_remove_legacy_cache_files(tmp_path, output_dir):
+    (output_dir / ".manifest.cache.json").write_text("{}")
+    (output_dir / ".build_state.json").write_text("{}")
+    (output_dir / ".nojekyll").write_text("")
+    (output_dir / "index.html.sha256").write_text("0" * 64)
+
+    checksums = calculate_checksums(str(output_dir), cache_path=tmp_path / "cache.json")
+
+    assert [path for path, _, _ in checksums] == [".nojekyll", "index.html"]
+    assert not (output_dir / ".manifest.cache.json").exists()
+    assert not (output_dir / ".build_state.json").exists()
+
+
+def test_cache_path_is_outside_output(tmp_path, output_dir):
+    cache_path = build.cache_path_for(build.MANIFEST_CACHE_NAME, output_dir)
+
+    assert cache_path.parent == build.CACHE_DIR
+    assert output_dir not in cache_path.parents
+    assert cache_path != build.cache_path_for(build.MANIFEST_CACHE_NAME, tmp_path / "other")
+
+
+def _read_tree(root):
+    # Gzip headers carry a write time, so compare what they decompress to
+    return {
+        path.relative_to(root).as_posix(): (
+            gzip.decompress(path.read_bytes()) if path.suffix == ".gz" else path.read_bytes()
+        )
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+def _failing_exporter(db, output_dir):
+    raise RuntimeError(f"export failed with {len(db.brands)} brands")
+
+
+def test_run_export_steps_matches_in_process_export(tmp_path, sample_tree, capfd):
+    db, _ = crawl_data(str(sample_tree / "data"), str(sample_tree / "stores"))
+    pooled = tmp_path / "pooled"
+    direct = tmp_path / "direct"
+    common = {"version": "2026.1.0", "generated_at": "2026-01-01T00:00:00Z"}
+
+    run_export_steps(
+        db,
+        [
+            ("JSON", export_json, {**common, "output_dir": str(pooled)}),
+            ("CSV", export_csv, {**common, "output_dir": str(pooled)}),
+        ],
+    )
+    export_json(db, str(direct), **common)
+    export_csv(db, str(direct), **common)
+
+    assert _read_tree(pooled) == _read_tree(direct)
+    # Progress printed by the workers reaches the shared stdout
+    out = capfd.readouterr().out
+    assert f"Written: {pooled / 'csv'}" in out
+    assert "Finished: JSON" in out
+    assert "Finished: CSV" in out
+
+
+def test_run_export_steps_reraises_worker_errors(tmp_path, sample_tree):
+    db, _ = crawl_data(str(sample_tree / "data"), str(sample_tree / "stores"))
+
+    with pytest.raises(RuntimeError, match="export failed with 3 brands"):
+        run_export_steps(db, [("Broken", _failing_exporter, {"output_dir": str(tmp_path)})])
+
+
+def test_run_export_steps_without_steps():
+    run_export_steps(Database(), [])
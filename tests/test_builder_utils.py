@@ -0,0 +1,113 @@
+"""Tests for the OFD identifier derivation in ofd.builder.utils."""
+
+import json
+import math
+import uuid
+
+import pytest
+
+from ofd.builder.utils import (
+    generate_brand_id,
+    generate_brand_uuid,
+    generate_filament_id,
+    generate_instance_uuid,
+    generate_material_id,
+    generate_material_uuid,
+    generate_package_uuid,
+    generate_purchase_link_id,
+    generate_size_id,
+    generate_store_id,
+    generate_variant_id,
+    loads_json,
+)
+
+BRAND_UUID = "ae5ff34e-298e-50c9-8f77-92a97fb30b09"
+
+
+def test_brand_uuid():
+    assert generate_brand_uuid("Prusament") == BRAND_UUID
+    assert generate_brand_id("Prusament") == BRAND_UUID
+
+
+def test_material_uuid():
+    assert (
+        generate_material_uuid(BRAND_UUID, "PLA Prusa Galaxy Black")
+        == "1aaca54a-431f-5601-adf5-85dd018f487f"
+    )
+
+
+def test_package_uuid():
+    assert generate_package_uuid(BRAND_UUID, "1234") == "7ed3ce83-764d-56de-bdcd-dc5226a0efd1"
+
+
+def test_instance_uuid():
+    nfc_tag_uid = b"\xe0\x04\x01\x08\x66\x2f\x6f\xbc"
+    assert generate_instance_uuid(nfc_tag_uid) == "bf63e92d-9ca5-53d7-9fab-ffdd0240c585"
+
+
+def test_derived_ids_are_canonical_uuid5():
+    derived = generate_material_uuid(BRAND_UUID, "PLA")
+    parsed = uuid.UUID(derived)
+    assert str(parsed) == derived
+    assert parsed.version == 5
+    assert parsed.variant == uuid.RFC_4122
+
+
+def test_entity_id_chain():
+    material_id = generate_material_id(BRAND_UUID, "PLA")
+    assert material_id == "8861325c-1c16-560c-83b3-195ef25afd43"
+
+    filament_id = generate_filament_id(BRAND_UUID, material_id, "Galaxy Black")
+    assert filament_id == "bf6e925d-60aa-56e3-b296-c31967caca5e"
+
+    variant_id = generate_variant_id(filament_id, "Black")
+    assert variant_id == "f0f301cd-f7a4-53a7-a8d1-b3ad48cc5f5c"
+
+    size_id = generate_size_id(
+        variant_id, {"filament_weight": 1000, "diameter": 1.75, "gtin": "8594173675087"}
+    )
+    assert size_id == "b8992e28-259f-56cb-a7a4-f4e5128533dd"
+
+    refill_id = generate_size_id(
+        variant_id, {"filament_weight": 1000, "spool_refill": True, "article_number": "A1"}, 2
+    )
+    assert refill_id == "f83bac2f-a6d3-5ff5-aade-88e8809d0897"
+
+    store_id = generate_store_id("prusa3d")
+    assert store_id == "a25e1e1b-5a6b-52c0-9d50-a356b1b18477"
+
+    link_id = generate_purchase_link_id(size_id, store_id, "https://www.prusa3d.com/product/x")
+    assert link_id == "46c66730-e8a6-5997-9cc3-f0baab22c329"
+
+
+def test_parent_uuid_forms():
+    # Parent UUIDs are parsed through a cache; every accepted form gives the same ID
+    expected = generate_material_uuid(BRAND_UUID, "PLA")
+    assert generate_material_uuid(uuid.UUID(BRAND_UUID), "PLA") == expected
+    assert generate_material_uuid(BRAND_UUID.upper(), "PLA") == expected
+    assert generate_material_uuid(BRAND_UUID, "PLA") == expected
+
+
+def test_loads_json():
+    assert loads_json('{"color": "Žlutá", "weight": 1000}'.encode()) == {
+        "color": "Žlutá",
+        "weight": 1000,
+    }
+
+
+def test_loads_json_accepts_what_the_stdlib_accepts():
+    data = loads_json(b'{"nan": NaN, "inf": Infinity}')
+    assert math.isnan(data["nan"])
+    assert data["inf"] == math.inf
+
+
+def test_loads_json_keeps_wide_integers_exact():
+    data = loads_json(b'{"big": 18446744073709551617, "small": -9223372036854775809}')
+    assert data == {"big": 18446744073709551617, "small": -9223372036854775809}
+    assert type(data["big"]) is int
+    assert type(data["small"]) is int
+
+
+def test_loads_json_invalid():
+    with pytest.raises(json.JSONDecodeError):
+        loads_json(b"{not json")
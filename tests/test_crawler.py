@@ -0,0 +1,68 @@
+"""Tests for the builder's data crawler."""
+
+import pytest
+
+from ofd.builder.crawler import DataCrawler
+
+ENTITY_FILES = (
+    "store.json",
+    "brand.json",
+    "material.json",
+    "filament.json",
+    "variant.json",
+    "sizes.json",
+)
+
+
+def _crawl(root, prefetch=True, monkeypatch=None):
+    crawler = DataCrawler(str(root / "data"), str(root / "stores"))
+    if not prefetch:
+        monkeypatch.setattr(crawler, "_prefetch_json", lambda: None)
+    db, result = crawler.crawl()
+    return crawler, db, result
+
+
+def _messages(result):
+    return [(e.level, e.category, e.message, e.path) for e in result.errors]
+
+
+@pytest.fixture
+def damaged_tree(sample_tree):
+    """Sample tree with an unreadable variant and a stray hidden brand."""
+    variant = next(sample_tree.glob("data/*/*/*/*/variant.json"))
+    variant.write_text("{not json")
+    hidden = sample_tree / "data" / ".trash" / "brand.json"
+    hidden.parent.mkdir()
+    hidden.write_text('{"name": "Deleted"}')
+    return sample_tree
+
+
+def test_prefetch_matches_direct_reads(damaged_tree, monkeypatch):
+    _, prefetched_db, prefetched_result = _crawl(damaged_tree)
+    _, direct_db, direct_result = _crawl(damaged_tree, prefetch=False, monkeypatch=monkeypatch)
+
+    assert prefetched_db == direct_db
+    assert _messages(prefetched_result) == _messages(direct_result)
+    assert any("variant.json" in str(path) for *_, path in _messages(prefetched_result))
+    assert "Deleted" not in {brand["name"] for brand in prefetched_db.brands}
+
+
+def test_prefetch_reads_every_entity_file(sample_tree):
+    crawler = DataCrawler(str(sample_tree / "data"), str(sample_tree / "stores"))
+    crawler._prefetch_json()
+
+    expected = {
+        path
+        for root in (sample_tree / "data", sample_tree / "stores")
+        for name in ENTITY_FILES
+        for path in root.rglob(name)
+    }
+    assert set(crawler._json_bytes) == expected
+    assert all(raw == path.read_bytes() for path, raw in crawler._json_bytes.items())
+
+
+def test_prefetched_contents_are_released(sample_tree):
+    crawler, db, _ = _crawl(sample_tree)
+
+    assert db.brands
+    assert crawler._json_bytes == {}
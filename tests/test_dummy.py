@@ -1,3 +0,0 @@
-# Delete once real tests exist. Verifies the pytest setup is functional.
-def test_pytest_setup():
-    assert 1 == 1, "math is not mathing"
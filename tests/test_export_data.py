@@ -0,0 +1,117 @@
+"""Tests for the export_data script."""
+
+import argparse
+import json
+
+import pytest
+
+from ofd.scripts.export_data import ExportDataScript
+
+
+def _write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    data = root / "data"
+    _write_json(data / "acme" / "brand.json", {"name": "Acme"})
+    (data / "acme" / "logo.png").write_bytes(b"\x89PNG")
+    _write_json(data / "acme" / "pla" / "material.json", {"material": "PLA"})
+    _write_json(data / "acme" / "pla" / "basic" / "filament.json", {"name": "Basic"})
+    _write_json(
+        data / "acme" / "pla" / "basic" / "black" / "variant.json",
+        {"name": "Black", "color_hex": "#000000"},
+    )
+    _write_json(
+        data / "acme" / "pla" / "basic" / "black" / "sizes.json",
+        [{"filament_weight": 1000, "purchase_links": [{"store_id": "shop", "url": "u"}]}],
+    )
+    # Both brands below export to the "Acme Tools" folder
+    _write_json(data / "acme_tools" / "brand.json", {"name": "Acme/Tools", "rev": 1})
+    _write_json(data / "acme_tools" / "pla" / "material.json", {"material": "PLA"})
+    _write_json(data / "acme_tools_2" / "brand.json", {"name": "Acme Tools", "rev": 2})
+    _write_json(data / "acme_tools_2" / "petg" / "material.json", {"material": "PETG"})
+    (data / "broken").mkdir()
+    (data / "broken" / "brand.json").write_text("{not json")
+    _write_json(root / "stores" / "shop" / "store.json", {"id": "shop", "name": "Shop"})
+    (root / "schemas").mkdir()
+    return root
+
+
+def _run(project, *argv):
+    script = ExportDataScript(project)
+    parser = argparse.ArgumentParser()
+    script.configure_parser(parser)
+    return script.run(parser.parse_args(list(argv)))
+
+
+def _read_tree(root):
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+def _exported(data):
+    return (json.dumps(data, indent=4, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def test_export_tree(project, tmp_path):
+    result = _run(project, "-o", str(tmp_path / "out"))
+
+    assert not result.success  # the broken brand is reported as an error
+    assert result.data["stats"] == {
+        "brands": 3,
+        "materials": 3,
+        "filaments": 1,
+        "variants": 1,
+        "sizes": 1,
+        "stores": 1,
+        "purchase_links": 1,
+        "errors": 1,
+    }
+    assert _read_tree(tmp_path / "out") == {
+        "data/Acme/PLA/Basic/Black/sizes.json": _exported(
+            [{"filament_weight": 1000, "purchase_links": [{"store_id": "shop", "url": "u"}]}]
+        ),
+        "data/Acme/PLA/Basic/Black/variant.json": _exported(
+            {"name": "Black", "color_hex": "#000000"}
+        ),
+        "data/Acme/PLA/Basic/filament.json": _exported({"name": "Basic"}),
+        "data/Acme/PLA/material.json": _exported({"material": "PLA"}),
+        "data/Acme/brand.json": _exported({"name": "Acme"}),
+        "data/Acme/logo.png": b"\x89PNG",
+        # Colliding brands are exported in sorted order, the later one wins
+        "data/Acme Tools/PETG/material.json": _exported({"material": "PETG"}),
+        "data/Acme Tools/PLA/material.json": _exported({"material": "PLA"}),
+        "data/Acme Tools/brand.json": _exported({"name": "Acme Tools", "rev": 2}),
+        "stores/shop/store.json": _exported({"id": "shop", "name": "Shop"}),
+    }
+
+
+def test_export_is_deterministic(project, tmp_path):
+    trees = []
+    for attempt in range(5):
+        output = tmp_path / f"out{attempt}"
+        _run(project, "-o", str(output))
+        trees.append(_read_tree(output))
+
+    assert all(tree == trees[0] for tree in trees)
+
+
+def test_dry_run_reports_in_brand_order(project, tmp_path, capsys):
+    _run(project, "-o", str(tmp_path / "out"), "--dry-run")
+
+    lines = capsys.readouterr().out.splitlines()
+    start = lines.index("Exporting data...") + 1
+    assert lines[start : start + 4] == [
+        "  Brand: Acme",
+        "  Brand: Acme/Tools",
+        "  Brand: Acme Tools",
+        f"Failed to parse JSON from file: {project / 'data' / 'broken' / 'brand.json'}",
+    ]
+    assert not (tmp_path / "out").exists()
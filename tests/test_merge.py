@@ -0,0 +1,42 @@
+"""Tests for the folder merge helpers in ofd.merge."""
+
+import json
+
+from ofd.merge import load_json, merge_has_errors, merge_trees
+
+
+def test_load_json_falls_back_to_stdlib(tmp_path):
+    path = tmp_path / "sizes.json"
+    path.write_text('[{"filament_weight": 1000, "gtin": 18446744073709551617, "note": NaN}]')
+
+    data = load_json(path)
+
+    assert data[0]["gtin"] == 18446744073709551617
+    assert type(data[0]["gtin"]) is int
+    assert data[0]["note"] != data[0]["note"]  # NaN
+
+
+def test_load_json_unreadable(tmp_path):
+    path = tmp_path / "brand.json"
+    path.write_text("{not json")
+
+    assert load_json(path) is None
+    assert load_json(tmp_path / "missing.json") is None
+
+
+def test_merge_trees_reads_stdlib_only_json(tmp_path):
+    source = tmp_path / "acme-tools"
+    target = tmp_path / "acme_tools"
+    source.mkdir()
+    target.mkdir()
+    (source / "brand.json").write_text('{"name": "Acme", "id": 18446744073709551617}')
+    (target / "brand.json").write_text('{"name": "Acme", "website": ""}')
+
+    actions = merge_trees(target, source)
+
+    assert not merge_has_errors(actions)
+    assert json.loads((target / "brand.json").read_text()) == {
+        "name": "Acme",
+        "website": "",
+        "id": 18446744073709551617,
+    }
@@ -0,0 +1,55 @@
+"""Tests for the optional Parquet export."""
+
+import sqlite3
+
+import pytest
+
+from ofd.builder.crawler import crawl_data
+from ofd.builder.exporters import export_parquet, export_sqlite, parquet_exporter
+
+COMMON = {"version": "2026.1.0", "generated_at": "2026-01-01T00:00:00Z"}
+TABLES = ("brand", "material", "filament", "variant", "size", "store", "purchase_link")
+
+
+def _by_id(row):
+    return row["id"]
+
+
+def test_export_parquet_without_pyarrow(tmp_path, sample_tree, monkeypatch, capsys):
+    db, _ = crawl_data(str(sample_tree / "data"), str(sample_tree / "stores"))
+    monkeypatch.setattr(parquet_exporter, "pa", None)
+
+    export_parquet(db, str(tmp_path), **COMMON)
+
+    assert "pyarrow is not installed" in capsys.readouterr().out
+    assert not (tmp_path / "parquet").exists()
+
+
+def test_parquet_tables_mirror_sqlite(tmp_path, sample_tree):
+    pq = pytest.importorskip("pyarrow.parquet")
+    db, _ = crawl_data(str(sample_tree / "data"), str(sample_tree / "stores"))
+
+    export_sqlite(db, str(tmp_path), **COMMON)
+    export_parquet(db, str(tmp_path), **COMMON)
+
+    conn = sqlite3.connect(tmp_path / "sqlite" / "filaments.db")
+    conn.row_factory = sqlite3.Row
+    try:
+        for table_name in TABLES:
+            table = pq.read_table(tmp_path / "parquet" / f"{table_name}s.parquet")
+            sqlite_rows = [dict(row) for row in conn.execute(f"SELECT * FROM {table_name}")]
+
+            assert table.schema.metadata[b"dataset_version"] == b"2026.1.0"
+            assert table.schema.metadata[b"generated_at"] == b"2026-01-01T00:00:00Z"
+            assert table.column_names == list(sqlite_rows[0].keys())
+            string_columns = {field.name for field in table.schema if str(field.type) == "string"}
+            expected = [
+                {
+                    name: str(value) if name in string_columns and value is not None else value
+                    for name, value in row.items()
+                }
+                for row in sqlite_rows
+            ]
+            assert sorted(table.to_pylist(), key=_by_id) == sorted(expected, key=_by_id)
+    finally:
+        conn.close()
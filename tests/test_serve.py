@@ -0,0 +1,131 @@
+"""Tests for gzip negotiation and conditional requests in the dev server."""
+
+import gzip
+import http.client
+import threading
+from functools import partial
+
+import pytest
+
+from ofd.commands.serve import CORSRequestHandler, DevServer, _accepts_gzip, _GzipCache
+
+JSON_BODY = b'{"brands": [' + b",".join(b'"brand %d"' % i for i in range(500)) + b"]}\n"
+
+
+@pytest.fixture
+def server(tmp_path):
+    (tmp_path / "json").mkdir()
+    (tmp_path / "json" / "all.json").write_bytes(JSON_BODY)
+    (tmp_path / "small.json").write_bytes(b"{}\n")
+    (tmp_path / "filaments.db.xz").write_bytes(b"\xfd7zXZ\x00" * 400)
+
+    httpd = DevServer(("127.0.0.1", 0), partial(CORSRequestHandler, directory=str(tmp_path)))
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(server, path, **headers):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+    try:
+        conn.request("GET", path, headers={k.replace("_", "-"): v for k, v in headers.items()})
+        response = conn.getresponse()
+        return response, response.read()
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip", True),
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, gzip;q=0.8", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("identity", False),
+        ("", False),
+    ],
+)
+def test_accepts_gzip(accept_encoding, expected):
+    assert _accepts_gzip(accept_encoding) is expected
+
+
+def test_gzip_cache_is_bounded():
+    cache = _GzipCache(max_bytes=10)
+    cache.put("a", 1, 1, b"12345")
+    cache.put("b", 1, 1, b"12345")
+    assert cache.get("a", 1, 1) == b"12345"
+
+    # "b" is now the least recently used entry and is evicted first
+    cache.put("c", 1, 1, b"123")
+    assert cache.get("b", 1, 1) is None
+    assert cache.get("a", 1, 1) == b"12345"
+    assert cache.get("c", 1, 1) == b"123"
+
+    # A changed file invalidates its entry
+    assert cache.get("a", 2, 1) is None
+
+
+def test_gzip_response(server, capsys):
+    response, body = _get(server, "/json/all.json", Accept_Encoding="gzip")
+
+    assert response.status == 200
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert response.getheader("Vary") == "Accept-Encoding"
+    assert response.getheader("Access-Control-Allow-Origin") == "*"
+    assert int(response.getheader("Content-Length")) == len(body)
+    assert gzip.decompress(body) == JSON_BODY
+
+
+def test_identity_response_varies_on_encoding(server, capsys):
+    response, body = _get(server, "/json/all.json")
+
+    assert response.status == 200
+    assert response.getheader("Content-Encoding") is None
+    assert response.getheader("Vary") == "Accept-Encoding"
+    assert body == JSON_BODY
+
+
+def test_small_and_binary_files_are_not_compressed(server, capsys):
+    response, body = _get(server, "/small.json", Accept_Encoding="gzip")
+    assert response.getheader("Content-Encoding") is None
+    assert body == b"{}\n"
+
+    response, _ = _get(server, "/filaments.db.xz", Accept_Encoding="gzip")
+    assert response.status == 200
+    assert response.getheader("Content-Encoding") is None
+    assert response.getheader("Vary") is None
+
+
+@pytest.mark.parametrize("accept_encoding", ["gzip", "identity"])
+def test_not_modified(server, capsys, accept_encoding):
+    response, _ = _get(server, "/json/all.json", Accept_Encoding=accept_encoding)
+    last_modified = response.getheader("Last-Modified")
+
+    response, body = _get(
+        server,
+        "/json/all.json",
+        Accept_Encoding=accept_encoding,
+        If_Modified_Since=last_modified,
+    )
+    assert response.status == 304
+    assert body == b""
+    assert response.getheader("Vary") == "Accept-Encoding"
+
+    response, _ = _get(
+        server,
+        "/json/all.json",
+        Accept_Encoding=accept_encoding,
+        If_Modified_Since="Thu, 01 Jan 1970 00:00:00 GMT",
+    )
+    assert response.status == 200
+
+
+def test_missing_file(server, capsys):
+    response, _ = _get(server, "/missing.json", Accept_Encoding="gzip")
+    assert response.status == 404
@@ -0,0 +1,251 @@
+"""Tests for the style_data script."""
+
+import copy
+import json
+import os
+import random
+
+import pytest
+from conftest import PROJECT_ROOT
+
+from ofd.scripts.style_data import (
+    FileResult,
+    SchemaInfo,
+    StyleCache,
+    build_key_order_map,
+    compile_reorder_plan,
+    load_json,
+    reorder_json_keys,
+)
+
+# Far enough in the past that the racy-mtime guard never applies
+OLD_MTIME_NS = 1_600_000_000 * 10**9
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    (root / "schemas").mkdir(parents=True)
+    (root / "schemas" / "brand_schema.json").write_text('{"type": "object"}')
+    brand = root / "data" / "acme" / "brand.json"
+    brand.parent.mkdir(parents=True)
+    brand.write_text('{\n  "name": "Acme"\n}\n')
+    os.utime(brand, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+    return root
+
+
+def _brand(root):
+    return root / "data" / "acme" / "brand.json"
+
+
+def _cache(root):
+    return StyleCache(root, root / "schemas")
+
+
+def _record_and_reload(root, result):
+    cache = _cache(root)
+    cache.record("style", _brand(root), result)
+    cache.save()
+    return _cache(root)
+
+
+def test_style_cache_skips_unchanged_clean_file(project):
+    result = FileResult(processed=True, clean=True, extra_key_names=["logo_url"])
+
+    cached = _record_and_reload(project, result).lookup("style", _brand(project))
+
+    assert cached.clean
+    assert cached.extra_keys == 1
+    assert cached.messages == ["  Warning: Extra keys in brand.json: ['logo_url']"]
+    # Sections are independent
+    assert _cache(project).lookup("indent", _brand(project)) is None
+
+
+def test_style_cache_misses_after_file_changes(project):
+    cache = _record_and_reload(project, FileResult(processed=True, clean=True))
+    brand = _brand(project)
+
+    brand.write_text('{\n  "name": "Acme Co"\n}\n')
+    os.utime(brand, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+    assert cache.lookup("style", brand) is None
+
+    brand.write_text('{\n  "name": "Acme"\n}\n')
+    os.utime(brand, ns=(OLD_MTIME_NS + 1, OLD_MTIME_NS + 1))
+    assert cache.lookup("style", brand) is None
+
+
+def test_style_cache_drops_unclean_files(project):
+    _record_and_reload(project, FileResult(processed=True, clean=True))
+
+    cache = _record_and_reload(project, FileResult(processed=True, clean=False))
+
+    assert cache.lookup("style", _brand(project)) is None
+
+
+def test_style_cache_does_not_trust_mtimes_near_the_save(project):
+    # Written just now: a second edit in the same tick would keep this mtime
+    _brand(project).write_text('{\n  "name": "Acme"\n}\n')
+
+    cache = _record_and_reload(project, FileResult(processed=True, clean=True))
+
+    assert cache.lookup("style", _brand(project)) is None
+
+
+def test_style_cache_is_dropped_when_schemas_change(project):
+    _record_and_reload(project, FileResult(processed=True, clean=True))
+
+    (project / "schemas" / "brand_schema.json").write_text('{"type": "object", "required": []}')
+
+    assert _cache(project).lookup("style", _brand(project)) is None
+
+
+def _sort_recursively(data, keys, nested, extra_keys):
+    """The original recursive sort_json_keys, kept as the reference ordering."""
+    if isinstance(data, dict):
+        ordered = {}
+        remaining_keys = set(data.keys())
+        for key in keys:
+            if key in data:
+                value = data[key]
+                if key in nested:
+                    if isinstance(value, list):
+                        value = [
+                            _sort_recursively(item, nested[key], nested, extra_keys)
+                            if isinstance(item, dict)
+                            else item
+                            for item in value
+                        ]
+                    else:
+                        value = _sort_recursively(value, nested[key], nested, extra_keys)
+                elif isinstance(value, dict):
+                    value = _sort_recursively(value, [], {}, extra_keys)
+                elif isinstance(value, list):
+                    value = [
+                        _sort_recursively(item, keys, nested, extra_keys)
+                        if isinstance(item, dict)
+                        else item
+                        for item in value
+                    ]
+                ordered[key] = value
+                remaining_keys.remove(key)
+        if remaining_keys:
+            extra_keys.update(remaining_keys)
+            for key in sorted(remaining_keys):
+                value = data[key]
+                if isinstance(value, dict):
+                    value = _sort_recursively(value, [], {}, extra_keys)
+                elif isinstance(value, list):
+                    value = [
+                        _sort_recursively(item, [], {}, extra_keys)
+                        if isinstance(item, dict)
+                        else item
+                        for item in value
+                    ]
+                ordered[key] = value
+        return ordered
+    if isinstance(data, list):
+        return [
+            _sort_recursively(item, keys, nested, extra_keys)
+            if isinstance(item, (dict, list))
+            else item
+            for item in data
+        ]
+    return data
+
+
+def _shuffled(data, rng):
+    """Copy of data with the keys of every object in a random order."""
+    if isinstance(data, dict):
+        items = list(data.items())
+        rng.shuffle(items)
+        return {key: _shuffled(value, rng) for key, value in items}
+    if isinstance(data, list):
+        return [_shuffled(item, rng) for item in data]
+    return data
+
+
+def _assert_same_order(data, schema_info):
+    expected_extra: set[str] = set()
+    expected = _sort_recursively(
+        copy.deepcopy(data), schema_info.keys, schema_info.nested, expected_extra
+    )
+    extra: set[str] = set()
+
+    moved = reorder_json_keys(data, schema_info, extra)
+
+    # json.dumps keeps insertion order, so equal output means equal key order
+    assert json.dumps(data) == json.dumps(expected)
+    assert extra == expected_extra
+    return moved
+
+
+def _schema_info(keys, nested):
+    return SchemaInfo(keys=keys, nested=nested, plan=compile_reorder_plan(keys, nested))
+
+
+def test_reorder_json_keys_matches_recursive_sort():
+    schema_info = _schema_info(
+        ["id", "name", "specs", "links", "meta"],
+        {
+            "specs": ["diameter", "weight"],
+            "links": ["store_id", "url"],
+            "weight": ["value", "unit"],
+        },
+    )
+    data = {
+        "zeta": {"b": 1, "a": {"d": 1, "c": 2}},
+        "links": [{"url": "u", "store_id": "s", "extra": 1}, "x", [{"b": 1, "a": 2}]],
+        "specs": {
+            "weight": {"unit": "g", "value": 1, "zz": 0},
+            "diameter": 1.75,
+            "other": {"y": 1, "x": 2},
+        },
+        "name": "n",
+        "id": "i",
+        "meta": [{"q": 1, "name": "m", "id": 2, "specs": {"weight": 3, "diameter": 4}}],
+        "alpha": [{"k2": 1, "k1": {"n2": 1, "n1": 2}}, [{"y": 1, "x": 2}]],
+    }
+
+    assert _assert_same_order(data, schema_info)
+    # Already sorted data is left as it is
+    assert not _assert_same_order(data, schema_info)
+
+
+def test_reorder_json_keys_handles_top_level_lists():
+    schema_info = _schema_info(
+        ["filament_weight", "purchase_links"], {"purchase_links": ["store_id", "url"]}
+    )
+    data = [
+        {"purchase_links": [{"url": "u", "store_id": "s"}], "filament_weight": 1000},
+        {"filament_weight": 250, "gtin": "123"},
+        [{"purchase_links": [], "filament_weight": 1}],
+    ]
+
+    assert _assert_same_order(data, schema_info)
+
+
+def test_reorder_plans_follow_self_nested_keys():
+    schema_info = _schema_info(["name", "children"], {"children": ["name", "children", "weight"]})
+    data = {
+        "children": [
+            {"weight": 1, "children": [{"children": [], "weight": 2, "name": "c"}], "name": "b"}
+        ],
+        "name": "a",
+    }
+
+    assert _assert_same_order(data, schema_info)
+
+
+def test_reorder_plans_match_recursive_sort_on_real_files(sample_tree):
+    key_order_map = build_key_order_map(PROJECT_ROOT / "schemas")
+    rng = random.Random(0)
+    checked = 0
+
+    for path in sorted(sample_tree.rglob("*.json")):
+        data = _shuffled(load_json(path), rng)
+        if isinstance(data, dict):
+            data["zz_extra"] = {"b": [{"d": 1, "c": 2}], "a": 1}
+        _assert_same_order(data, key_order_map[path.stem])
+        checked += 1
+
+    assert checked > 300